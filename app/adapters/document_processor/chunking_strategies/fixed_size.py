@@ -74,7 +74,7 @@ class FixedSizeChunkingStrategy(ChunkingStrategy):
                         'word_count': len(chunk_content.split()),
                         'char_count': len(chunk_content),
                         'collection_id': document.collection_id,
-                        'document_type': str(document.document_type.value),
+                        'document_type': document.document_type,
                         'chunking_strategy': 'fixed_size',
                         **document.metadata
                     }
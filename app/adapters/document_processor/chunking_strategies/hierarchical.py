@@ -299,7 +299,7 @@ class HierarchicalChunkingStrategy(ChunkingStrategy):
             'has_lists': any(part['type'] == 'list' for part in content_parts),
             'has_tables': any(part['type'] == 'table' for part in content_parts),
             'collection_id': document.collection_id,  # Important for filtering
-            'document_type': str(document.document_type.value),
+            'document_type': document.document_type,
             'chunking_strategy': 'hierarchical'
         }
 
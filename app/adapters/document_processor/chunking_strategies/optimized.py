@@ -343,7 +343,7 @@ class OptimizedHierarchicalChunkingStrategy(ChunkingStrategy):
             'has_tables': any(e.element_type == 'table' for e in elements),
             'element_count': len(elements),
             'collection_id': document.collection_id,
-            'document_type': str(document.document_type.value),
+            'document_type': document.document_type,
             'chunking_strategy': 'optimized_hierarchical',
             'overlap_tokens': self.overlap_tokens,
             'structure_preserved': True
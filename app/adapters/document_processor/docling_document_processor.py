@@ -1,10 +1,13 @@
+import asyncio
+import importlib.util
+import io
 import logging
+import math
 import os
-from typing import List, Dict, Any, Tuple
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Literal, Optional, Tuple, Union
 
 from ...core.ports.document_processor import DocumentProcessor
 from ...core.domain.entities.document import Document
@@ -14,6 +17,60 @@ from ...core.ports.token_service import TokenService
 
 from app.config import settings
 
+if TYPE_CHECKING:
+    from docling.datamodel.base_models import DocumentStream
+    from docling.document_converter import DocumentConverter
+
+logger = logging.getLogger(__name__)
+
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Summed per-piece token counts are an estimate: BPE merges across the join
+# separator, so a chunk whose estimate reaches this fraction of chunk_size is
+# re-counted as a whole before it is emitted
+_RECOUNT_RATIO = 0.9
+
+
+@lru_cache(maxsize=4)
+def _build_converter(enable_ocr: bool, extract_tables: bool) -> "DocumentConverter":
+    """
+    Build a Docling DocumentConverter with optimized settings.
+    Cached per option set so every processor in the process shares one warm
+    converter (and its loaded models) instead of re-initializing the backend.
+    """
+    # Imported here so importing this module does not pull in torch and the
+    # Docling model stack until a converter is actually needed
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+    
+    # Disable symlinks on Windows
+    if os.name == 'nt':
+        os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
+    
+    # Configure PDF pipeline options
+    pdf_options = PdfPipelineOptions()
+    pdf_options.do_ocr = enable_ocr
+    pdf_options.do_table_structure = extract_tables
+    
+    # Create format options
+    format_options = {
+        InputFormat.PDF: PdfFormatOption(
+            pipeline_options=pdf_options,
+            backend=PyPdfiumDocumentBackend
+        )
+    }
+    
+    # Initialize converter
+    converter = DocumentConverter(
+        format_options=format_options
+    )
+    
+    logger.info("Successfully initialized Docling DocumentConverter")
+    return converter
+
 class DoclingModelManager:
     """Manages Docling model downloads and caching"""
     
@@ -40,40 +97,88 @@ class DoclingModelManager:
                     from huggingface_hub import constants
                     constants.HF_HUB_DISABLE_SYMLINKS = True
                 except Exception as e:
-                    self.logger.warning(f"Could not disable HF symlinks: {e}")
+                    self.logger.warning("Could not disable HF symlinks: %s", e)
+            
+            # Use hf_transfer's parallel Rust downloader when it is installed.
+            # huggingface_hub reads the flag at import, so update the loaded constant too
+            if importlib.util.find_spec("hf_transfer") is not None:
+                if os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1") == "1":
+                    try:
+                        from huggingface_hub import constants
+                        constants.HF_HUB_ENABLE_HF_TRANSFER = True
+                    except Exception as e:
+                        self.logger.warning("Could not enable hf_transfer: %s", e)
+            
+            cache_dir = self._resolve_cache_dir()
             
             self.logger.info("Checking Docling models...")
             
             # Import huggingface_hub for model downloading
             try:
-                from huggingface_hub import snapshot_download
-                
-                for model_name in self.REQUIRED_MODELS:
-                    try:
-                        self.logger.info(f"Ensuring model is cached: {model_name}")
-                        download_kwargs = {
-                            "repo_id": model_name,
-                            "local_files_only": False,  # Download if not cached
-                            "resume_download": True,
-                        }
-                        if os.name == "nt":
-                            download_kwargs["local_dir_use_symlinks"] = False
-                        snapshot_download(**download_kwargs)
-                        self.logger.info(f"Model ready: {model_name}")
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Could not pre-download model {model_name}: {e}. "
-                            f"Will attempt to download on first use."
-                        )
-                
+                import huggingface_hub  # noqa: F401
             except ImportError:
                 self.logger.warning(
                     "huggingface_hub not available for pre-downloading models. "
                     "Models will be downloaded on first use."
                 )
+                return
+            
+            # Independent repos download concurrently; each snapshot_download
+            # already parallelizes the files within its repo
+            models = self.REQUIRED_MODELS
+            with ThreadPoolExecutor(max_workers=min(8, len(models))) as executor:
+                list(executor.map(lambda name: self._download_one(name, cache_dir), models))
             
         except Exception as e:
-            self.logger.warning(f"Model pre-download check failed: {e}")
+            self.logger.warning("Model pre-download check failed: %s", e)
+    
+    def _download_one(self, model_name: str, cache_dir: Optional[str]) -> None:
+        """Make sure a single model snapshot is in the local cache"""
+        from huggingface_hub import snapshot_download
+        from huggingface_hub.utils import LocalEntryNotFoundError
+        
+        try:
+            self.logger.info("Ensuring model is cached: %s", model_name)
+            download_kwargs = {
+                "repo_id": model_name,
+                "local_files_only": False,  # Download if not cached
+                "resume_download": True,
+            }
+            if cache_dir:
+                download_kwargs["cache_dir"] = cache_dir
+            if os.name == "nt":
+                download_kwargs["local_dir_use_symlinks"] = False
+            try:
+                # Warm caches resolve without any request to the Hub API
+                snapshot_download(
+                    repo_id=model_name,
+                    cache_dir=cache_dir,
+                    local_files_only=True,
+                )
+            except (LocalEntryNotFoundError, FileNotFoundError):
+                snapshot_download(**download_kwargs)
+            self.logger.info("Model ready: %s", model_name)
+        except Exception as e:
+            self.logger.warning(
+                "Could not pre-download model %s: %s. "
+                "Will attempt to download on first use.",
+                model_name, e
+            )
+    
+    @staticmethod
+    def _resolve_cache_dir() -> Optional[str]:
+        """
+        Resolve the Hugging Face hub cache from the environment so a shared
+        (e.g. NFS-mounted) cache is reused instead of re-downloading per container.
+        """
+        cache_dir = os.environ.get("HF_HUB_CACHE") or os.environ.get("HUGGINGFACE_HUB_CACHE")
+        if cache_dir:
+            return cache_dir
+        hf_home = os.environ.get("HF_HOME")
+        if hf_home:
+            # Hub snapshots live under $HF_HOME/hub, which is where Docling looks at runtime
+            return os.path.join(hf_home, "hub")
+        return None
 
 
 class DoclingDocumentProcessor(DocumentProcessor):
@@ -82,6 +187,11 @@ class DoclingDocumentProcessor(DocumentProcessor):
     DEFAULT_CHUNK_SIZE = 1000
     DEFAULT_CHUNK_OVERLAP = 200
     DEFAULT_MIN_CHUNK_SIZE = 100
+    # How far (in characters) a sliding-window boundary may move to land on
+    # a paragraph or sentence break
+    BOUNDARY_SNAP_CHARS = 64
+    # Small uploads are handed to Docling as a DocumentStream
+    accepts_in_memory_content = True
     
     def __init__(
         self,
@@ -93,6 +203,8 @@ class DoclingDocumentProcessor(DocumentProcessor):
         extract_tables: bool = True,
         extract_images: bool = False,
         preload_models: bool = True,
+        split_method: Literal["recursive", "sliding_window"] = "recursive",
+        text_format: Literal["markdown", "text"] = "text",
     ):
         """
         Initialize the Docling processor
@@ -106,18 +218,28 @@ class DoclingDocumentProcessor(DocumentProcessor):
             extract_tables: Extract tables from documents
             extract_images: Extract images from documents
             preload_models: Pre-download models during initialization
+            split_method: "recursive" splits on paragraphs, then sentences, then words;
+                "sliding_window" tokenizes once and slides a chunk_size window
+            text_format: "text" exports plain text; "markdown" also renders tables
+                and headings as markdown at the cost of an extra serialization pass
         """
         self.logger = logging.getLogger(__name__)
         self.token_service = token_service
-        
         self._validate_chunk_parameters(chunk_size, chunk_overlap, min_chunk_size)
+        if split_method not in ("recursive", "sliding_window"):
+            raise ValueError(f"split_method must be 'recursive' or 'sliding_window', got {split_method}")
+        if text_format not in ("markdown", "text"):
+            raise ValueError(f"text_format must be 'markdown' or 'text', got {text_format}")
         
         self.chunk_size = chunk_size
+        self._recount_threshold = int(chunk_size * _RECOUNT_RATIO)
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
         self.enable_ocr = enable_ocr
         self.extract_tables = extract_tables
         self.extract_images = extract_images
+        self.split_method = split_method
+        self.text_format = text_format
         
         # Pre-download models if requested (recommended for production)
         if preload_models:
@@ -126,45 +248,28 @@ class DoclingDocumentProcessor(DocumentProcessor):
         
         # Initialize Docling converter with optimized settings
         self.converter = self._initialize_converter()
+        # Conversion is CPU-bound and runs in worker threads; cap how many
+        # documents convert at once so concurrent uploads don't oversubscribe
+        self._convert_semaphore = asyncio.Semaphore(settings.max_concurrent_processes)
         
         self.supported_types = settings.SUPPORTED_DOCUMENT_TYPES
         
         self.logger.info(
-            f"Initialized DoclingDocumentProcessor with chunk_size={chunk_size}, "
-            f"chunk_overlap={chunk_overlap}, min_chunk_size={min_chunk_size}, "
-            f"ocr={enable_ocr}, tables={extract_tables}, images={extract_images}"
+            "Initialized DoclingDocumentProcessor with chunk_size=%d, "
+            "chunk_overlap=%d, min_chunk_size=%d, "
+            "ocr=%s, tables=%s, images=%s, "
+            "split_method=%s, text_format=%s",
+            chunk_size, chunk_overlap, min_chunk_size,
+            enable_ocr, extract_tables, extract_images,
+            split_method, text_format
         )
     
-    def _initialize_converter(self) -> DocumentConverter:
-        """Initialize Docling DocumentConverter with optimized settings"""
+    def _initialize_converter(self) -> "DocumentConverter":
+        """Get the shared Docling DocumentConverter for this processor's options"""
         try:
-            # Disable symlinks on Windows
-            if os.name == 'nt':
-                os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
-            
-            # Configure PDF pipeline options
-            pdf_options = PdfPipelineOptions()
-            pdf_options.do_ocr = self.enable_ocr
-            pdf_options.do_table_structure = self.extract_tables
-            
-            # Create format options
-            format_options = {
-                InputFormat.PDF: PdfFormatOption(
-                    pipeline_options=pdf_options,
-                    backend=PyPdfiumDocumentBackend
-                )
-            }
-            
-            # Initialize converter
-            converter = DocumentConverter(
-                format_options=format_options
-            )
-            
-            self.logger.info("Successfully initialized Docling DocumentConverter")
-            return converter
-            
+            return _build_converter(self.enable_ocr, self.extract_tables)
         except Exception as e:
-            self.logger.error(f"Failed to initialize Docling converter: {str(e)}")
+            self.logger.error("Failed to initialize Docling converter: %s", e)
             raise DocumentProcessingError(f"Converter initialization failed: {str(e)}")
     
     def _validate_chunk_parameters(
@@ -190,109 +295,252 @@ class DoclingDocumentProcessor(DocumentProcessor):
         
         if min_chunk_size > chunk_size * 4:  # Rough token-to-char conversion
             self.logger.warning(
-                f"min_chunk_size ({min_chunk_size} chars) may be larger than "
-                f"chunk_size ({chunk_size} tokens ≈ {chunk_size * 4} chars)"
+                "min_chunk_size (%d chars) may be larger than "
+                "chunk_size (%d tokens ≈ %d chars)",
+                min_chunk_size, chunk_size, chunk_size * 4
             )
     
+    def _count(self, text: str, cache: Dict[str, int]) -> int:
+        """Count tokens through the caller's per-document memo"""
+        count = cache.get(text)
+        if count is None:
+            count = self.token_service.count_tokens(text)
+            cache[text] = count
+        return count
+    
+    def _count_batch(self, texts: List[str], cache: Dict[str, int]) -> List[int]:
+        """Count tokens for many texts, batching only the ones not yet memoized"""
+        missing = list(dict.fromkeys(t for t in texts if t not in cache))
+        if missing:
+            counts = self.token_service.count_tokens_batch(missing)
+            cache.update(zip(missing, counts))
+        return [cache[t] for t in texts]
+    
+    def _join_within_limit(
+        self,
+        pieces: List[str],
+        separator: str,
+        estimate: float,
+        cache: Dict[str, int]
+    ) -> List[str]:
+        """
+        Join pieces into one chunk, re-counting the joined text when the summed
+        estimate is close to chunk_size and halving the pieces if it is over
+        """
+        joined = separator.join(pieces)
+        if len(pieces) == 1:
+            return [joined]
+        # Allow a token for each separator the per-piece counts never saw
+        if estimate + len(pieces) - 1 < self._recount_threshold:
+            return [joined]
+        if self._count(joined, cache) <= self.chunk_size:
+            return [joined]
+        
+        mid = len(pieces) // 2
+        return (
+            self._join_within_limit(pieces[:mid], separator, float("inf"), cache)
+            + self._join_within_limit(pieces[mid:], separator, float("inf"), cache)
+        )
+    
     async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
         """Process a document and return token-based chunks and complete text"""
         try:
-            if document.document_type.value not in self.supported_types:
-                raise InvalidDocumentTypeError(
-                    f"Document type {document.document_type.value} not supported"
-                )
+            self._check_supported_type(document)
             
-            self.logger.info(f"Starting Docling extraction for document {document.id}")
+            self.logger.info("Starting Docling extraction for document %s", document.id)
             
             # Extract text and metadata using Docling
-            complete_text, doc_metadata = await self._extract_with_docling(document.file_path)
-            
-            if not complete_text or len(complete_text.strip()) == 0:
-                raise DocumentProcessingError("No text content extracted from document")
-            
-            self.logger.info(
-                f"Extracted {len(complete_text)} characters from document {document.id}"
+            complete_text, doc_metadata = await self._extract_with_docling(
+                self._document_source(document)
             )
             
-            # Create token-based chunks
-            doc_chunks = await self._create_token_chunks(
-                document=document,
-                text=complete_text,
-                doc_metadata=doc_metadata
-            )
-            
-            self.logger.info(f"Created {len(doc_chunks)} chunks for document {document.id}")
-            
-            return doc_chunks, complete_text
+            return await self._chunk_document(document, complete_text, doc_metadata)
             
         except Exception as e:
-            self.logger.error(f"Failed to process document {document.filename}: {str(e)}")
+            self.logger.error("Failed to process document %s: %s", document.filename, e)
             raise DocumentProcessingError(
                 f"Failed to process document {document.filename}: {str(e)}"
             )
     
-    async def _extract_with_docling(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
-        """Extract text and metadata from document using Docling"""
+    async def process_documents(
+        self, documents: List[Document]
+    ) -> List[Tuple[List[DocumentChunk], str]]:
+        """Convert a batch of documents in one Docling pass, then chunk each one"""
+        if not documents:
+            return []
+        
         try:
-            # Convert document
-            result = self.converter.convert(file_path)
+            for document in documents:
+                self._check_supported_type(document)
             
-            # Extract text content as markdown
-            complete_text = result.document.export_to_markdown()
-            
-            # Extract metadata
-            metadata = {
-                "page_count": len(result.document.pages) if hasattr(result.document, 'pages') else 0,
-                "has_tables": False,
-                "has_images": False,
-                "extraction_method": "docling"
-            }
+            self.logger.info("Starting Docling batch extraction for %d documents", len(documents))
             
-            # Check for tables and images if enabled
-            if self.extract_tables and hasattr(result.document, 'tables'):
-                metadata["has_tables"] = len(result.document.tables) > 0
-                metadata["table_count"] = len(result.document.tables)
+            extracted = await self._extract_batch_with_docling(
+                [self._document_source(document) for document in documents]
+            )
             
-            if self.extract_images and hasattr(result.document, 'pictures'):
-                metadata["has_images"] = len(result.document.pictures) > 0
-                metadata["image_count"] = len(result.document.pictures)
+            # Chunking is CPU-bound Python with no suspension points, so the
+            # documents are chunked one after another
+            return [
+                await self._chunk_document(document, complete_text, doc_metadata)
+                for document, (complete_text, doc_metadata) in zip(documents, extracted)
+            ]
             
-            self.logger.debug(
-                f"Docling extraction complete: {len(complete_text)} chars, "
-                f"{metadata.get('page_count', 0)} pages"
+        except Exception as e:
+            self.logger.error("Failed to process batch of %d documents: %s", len(documents), e)
+            raise DocumentProcessingError(
+                f"Failed to process batch of {len(documents)} documents: {str(e)}"
+            )
+    
+    def _check_supported_type(self, document: Document) -> None:
+        """Raise if the document type is not handled by this processor"""
+        if document.document_type not in self.supported_types:
+            raise InvalidDocumentTypeError(
+                f"Document type {document.document_type} not supported"
             )
+    
+    async def _chunk_document(
+        self,
+        document: Document,
+        complete_text: str,
+        doc_metadata: Dict[str, Any]
+    ) -> Tuple[List[DocumentChunk], str]:
+        """Chunk the text extracted from a document"""
+        if not complete_text or len(complete_text.strip()) == 0:
+            raise DocumentProcessingError("No text content extracted from document")
+        
+        self.logger.info(
+            "Extracted %d characters from document %s", len(complete_text), document.id
+        )
+        
+        # Create token-based chunks
+        doc_chunks = await self._create_token_chunks(
+            document=document,
+            text=complete_text,
+            doc_metadata=doc_metadata
+        )
+        
+        self.logger.info("Created %d chunks for document %s", len(doc_chunks), document.id)
+        
+        return doc_chunks, complete_text
+    
+    def _document_source(self, document: Document) -> Union[str, "DocumentStream"]:
+        """Return what Docling should read: the in-memory upload when present, else the file path"""
+        if document.content is None:
+            return document.file_path
+        
+        from docling.datamodel.base_models import DocumentStream
+        
+        # Docling detects the format from the name, so keep the original extension
+        return DocumentStream(
+            name=document.original_filename,
+            stream=io.BytesIO(document.content)
+        )
+    
+    async def _extract_with_docling(
+        self, source: Union[str, "DocumentStream"]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Extract text and metadata from a file path or in-memory stream using Docling"""
+        try:
+            # Convert document off the event loop
+            async with self._convert_semaphore:
+                result = await asyncio.to_thread(self.converter.convert, source)
             
-            return complete_text.strip(), metadata
+            return self._read_conversion_result(result)
             
         except Exception as e:
-            self.logger.error(f"Docling extraction failed for {file_path}: {str(e)}")
+            source_name = source if isinstance(source, str) else source.name
+            self.logger.error("Docling extraction failed for %s: %s", source_name, e)
             raise DocumentProcessingError(f"Docling extraction failed: {str(e)}")
     
+    async def _extract_batch_with_docling(
+        self, sources: List[Union[str, "DocumentStream"]]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Extract text and metadata from several documents with a single convert_all call"""
+        try:
+            # convert_all shares pipeline state and loaded models across the batch
+            async with self._convert_semaphore:
+                results = await asyncio.to_thread(
+                    lambda: list(self.converter.convert_all(sources))
+                )
+            
+            return [self._read_conversion_result(result) for result in results]
+            
+        except Exception as e:
+            self.logger.error("Docling batch extraction failed for %d files: %s", len(sources), e)
+            raise DocumentProcessingError(f"Docling batch extraction failed: {str(e)}")
+    
+    def _read_conversion_result(self, result) -> Tuple[str, Dict[str, Any]]:
+        """Read text and metadata from a Docling conversion result"""
+        # Extract text content; markdown only when consumers asked for it
+        if self.text_format == "markdown":
+            complete_text = result.document.export_to_markdown()
+        else:
+            complete_text = result.document.export_to_text()
+        
+        # Extract metadata
+        metadata = {
+            "page_count": len(result.document.pages) if hasattr(result.document, 'pages') else 0,
+            "has_tables": False,
+            "has_images": False,
+            "extraction_method": "docling",
+            "text_format": self.text_format
+        }
+        
+        # Check for tables and images if enabled
+        if self.extract_tables and hasattr(result.document, 'tables'):
+            metadata["has_tables"] = len(result.document.tables) > 0
+            metadata["table_count"] = len(result.document.tables)
+        
+        if self.extract_images and hasattr(result.document, 'pictures'):
+            metadata["has_images"] = len(result.document.pictures) > 0
+            metadata["image_count"] = len(result.document.pictures)
+        
+        self.logger.debug(
+            "Docling extraction complete: %d chars, %s pages",
+            len(complete_text), metadata.get('page_count', 0)
+        )
+        
+        return complete_text.strip(), metadata
+    
     async def _create_token_chunks(
         self,
         document: Document,
         text: str,
         doc_metadata: Dict[str, Any]
     ) -> List[DocumentChunk]:
-        """Create chunks based on token count using recursive approach"""
+        """Create chunks based on token count"""
         try:
-            chunks = []
+            # Memo of token counts for this document only; the recursive
+            # splitters re-count the same paragraphs, sentences and words, and
+            # a local dict keeps concurrent requests on the shared processor apart
+            tok_cache: Dict[str, int] = {}
+            
+            # Split text into chunks using the configured token-based splitting
+            if self.split_method == "sliding_window":
+                text_chunks = self._sliding_window_split(text)
+            else:
+                text_chunks = await self._recursive_token_split(text, tok_cache)
             
-            # Split text into chunks using recursive token-based splitting
-            text_chunks = await self._recursive_token_split(text)
+            # Checked once so skipped chunks cost nothing when DEBUG is off
+            log_skips = self.logger.isEnabledFor(logging.DEBUG)
             
+            chunks = []
+            
+            # Every splitter emits already-stripped text
             for i, chunk_text in enumerate(text_chunks):
-                if len(chunk_text.strip()) < self.min_chunk_size:
-                    self.logger.debug(f"Skipping chunk {i}: too small ({len(chunk_text)} chars)")
+                if len(chunk_text) < self.min_chunk_size:
+                    if log_skips:
+                        self.logger.debug("Skipping chunk %d: too small (%d chars)", i, len(chunk_text))
                     continue
                 
                 # Calculate token count for this chunk
-                token_count = self.token_service.count_tokens(chunk_text)
+                token_count = self._count(chunk_text, tok_cache)
                 
                 # Create chunk metadata
                 chunk_metadata = {
                     "document_filename": document.original_filename,
-                    "document_type": document.document_type.value,
+                    "document_type": document.document_type,
                     "chunk_token_count": token_count,
                     "chunk_char_count": len(chunk_text),
                     "processing_method": "docling_token_chunking",
@@ -302,7 +550,7 @@ class DoclingDocumentProcessor(DocumentProcessor):
                 # Create chunk
                 chunk = DocumentChunk.create(
                     document_id=document.id,
-                    content=chunk_text.strip(),
+                    content=chunk_text,
                     chunk_index=i,
                     metadata=chunk_metadata
                 )
@@ -312,16 +560,20 @@ class DoclingDocumentProcessor(DocumentProcessor):
             return chunks
             
         except Exception as e:
-            self.logger.error(f"Failed to create chunks: {str(e)}")
+            self.logger.error("Failed to create chunks: %s", e)
             raise DocumentProcessingError(f"Chunk creation failed: {str(e)}")
     
-    async def _recursive_token_split(self, text: str) -> List[str]:
+    async def _recursive_token_split(self, text: str, cache: Dict[str, int]) -> List[str]:
         """Recursively split text based on token count"""
         try:
-            # Check if text fits in one chunk
-            token_count = self.token_service.count_tokens(text)
+            # Check if text fits in one chunk. Character bounds avoid tokenizing
+            # the whole document: ASCII text never has more tokens than
+            # characters, and text over 8 characters per allowed token is too
+            # large in practice (a wrong guess only costs a paragraph split)
+            if len(text) <= self.chunk_size and text.isascii():
+                return [text]
             
-            if token_count <= self.chunk_size:
+            if len(text) <= self.chunk_size * 8 and self._count(text, cache) <= self.chunk_size:
                 return [text]
             
             # Text is too large, need to split
@@ -331,133 +583,142 @@ class DoclingDocumentProcessor(DocumentProcessor):
             paragraphs = text.split('\n\n')
             
             if len(paragraphs) > 1:
-                current_chunk = ""
+                # Collect pieces and join once per emitted chunk
+                current_pieces: List[str] = []
                 current_tokens = 0
                 
-                for paragraph in paragraphs:
-                    paragraph = paragraph.strip()
-                    if not paragraph:
-                        continue
-                    
-                    para_tokens = self.token_service.count_tokens(paragraph)
-                    
+                paragraphs = [p.strip() for p in paragraphs]
+                paragraphs = [p for p in paragraphs if p]
+                para_token_counts = self._count_batch(paragraphs, cache)
+                
+                for paragraph, para_tokens in zip(paragraphs, para_token_counts):
                     # If single paragraph is too large, split it further
                     if para_tokens > self.chunk_size:
                         # Save current chunk if it has content
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                            current_chunk = ""
+                        if current_pieces:
+                            chunks.extend(
+                                self._join_within_limit(current_pieces, "\n\n", current_tokens, cache)
+                            )
+                            current_pieces = []
                             current_tokens = 0
                         
                         # Recursively split the large paragraph
-                        para_chunks = await self._split_by_sentences(paragraph)
+                        para_chunks = await self._split_by_sentences(paragraph, cache)
                         chunks.extend(para_chunks)
                     else:
                         # Check if adding this paragraph exceeds chunk size
-                        if current_tokens + para_tokens > self.chunk_size and current_chunk:
+                        if current_tokens + para_tokens > self.chunk_size and current_pieces:
                             # Save current chunk and start new one
-                            chunks.append(current_chunk.strip())
-                            current_chunk = paragraph
+                            chunks.extend(
+                                self._join_within_limit(current_pieces, "\n\n", current_tokens, cache)
+                            )
+                            current_pieces = [paragraph]
                             current_tokens = para_tokens
                         else:
                             # Add to current chunk
-                            if current_chunk:
-                                current_chunk += "\n\n" + paragraph
-                                current_tokens += para_tokens
-                            else:
-                                current_chunk = paragraph
-                                current_tokens = para_tokens
+                            current_pieces.append(paragraph)
+                            current_tokens += para_tokens
                 
                 # Add remaining chunk
-                if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
+                if current_pieces:
+                    chunks.extend(
+                        self._join_within_limit(current_pieces, "\n\n", current_tokens, cache)
+                    )
             else:
                 # Single paragraph, split by sentences
-                chunks = await self._split_by_sentences(text)
+                chunks = await self._split_by_sentences(text, cache)
             
             # Apply overlap if we have multiple chunks
             if len(chunks) > 1 and self.chunk_overlap > 0:
-                chunks = await self._apply_overlap(chunks)
+                chunks = await self._apply_overlap(chunks, cache)
             
             return chunks
             
         except Exception as e:
-            self.logger.error(f"Failed in recursive token split: {str(e)}")
+            self.logger.error("Failed in recursive token split: %s", e)
             # Fallback to simple character-based splitting
             return self._fallback_character_split(text)
     
-    async def _split_by_sentences(self, text: str) -> List[str]:
+    async def _split_by_sentences(self, text: str, cache: Dict[str, int]) -> List[str]:
         """Split text by sentences using simple sentence boundary detection"""
         try:
             # Simple sentence splitting by common punctuation
-            import re
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+            sentences = _SENTENCE_SPLIT_RE.split(text)
             sentences = [s.strip() for s in sentences if s.strip()]
             
             if not sentences:
                 return [text]
             
             chunks = []
-            current_chunk = ""
+            current_pieces: List[str] = []
             current_tokens = 0
             
-            for sentence in sentences:
-                sent_tokens = self.token_service.count_tokens(sentence)
-                
+            sent_token_counts = self._count_batch(sentences, cache)
+            
+            for sentence, sent_tokens in zip(sentences, sent_token_counts):
                 # If single sentence is too large, split by words
                 if sent_tokens > self.chunk_size:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = ""
+                    if current_pieces:
+                        chunks.extend(
+                            self._join_within_limit(current_pieces, " ", current_tokens, cache)
+                        )
+                        current_pieces = []
                         current_tokens = 0
                     
                     # Split sentence by words
-                    word_chunks = await self._split_by_words(sentence)
+                    word_chunks = await self._split_by_words(sentence, cache)
                     chunks.extend(word_chunks)
+                elif current_tokens + sent_tokens > self.chunk_size and current_pieces:
+                    chunks.extend(
+                        self._join_within_limit(current_pieces, " ", current_tokens, cache)
+                    )
+                    current_pieces = [sentence]
+                    current_tokens = sent_tokens
                 else:
-                    if current_tokens + sent_tokens > self.chunk_size and current_chunk:
-                        chunks.append(current_chunk.strip())
-                        current_chunk = sentence
-                        current_tokens = sent_tokens
-                    else:
-                        if current_chunk:
-                            current_chunk += " " + sentence
-                            current_tokens += sent_tokens
-                        else:
-                            current_chunk = sentence
-                            current_tokens = sent_tokens
+                    current_pieces.append(sentence)
+                    current_tokens += sent_tokens
             
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
+            if current_pieces:
+                chunks.extend(
+                    self._join_within_limit(current_pieces, " ", current_tokens, cache)
+                )
             
             return chunks
             
         except Exception as e:
-            self.logger.error(f"Failed to split by sentences: {str(e)}")
+            self.logger.error("Failed to split by sentences: %s", e)
             return [text]
     
-    async def _split_by_words(self, text: str) -> List[str]:
+    async def _split_by_words(self, text: str, cache: Dict[str, int]) -> List[str]:
         """Split text by words when sentences are too large"""
         words = text.split()
         chunks = []
-        current_chunk = ""
+        current_words: List[str] = []
+        current_tokens = 0
         
-        for word in words:
-            test_chunk = f"{current_chunk} {word}".strip()
-            test_tokens = self.token_service.count_tokens(test_chunk)
-            
-            if test_tokens > self.chunk_size and current_chunk:
-                chunks.append(current_chunk)
-                current_chunk = word
+        # Count all words in one batch call and sum per-word counts rather
+        # than re-tokenizing the growing chunk
+        word_token_counts = self._count_batch(words, cache)
+        
+        for word, word_tokens in zip(words, word_token_counts):
+            if current_tokens + word_tokens > self.chunk_size and current_words:
+                chunks.extend(
+                    self._join_within_limit(current_words, " ", current_tokens, cache)
+                )
+                current_words = [word]
+                current_tokens = word_tokens
             else:
-                current_chunk = test_chunk
+                current_words.append(word)
+                current_tokens += word_tokens
         
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_words:
+            chunks.extend(
+                self._join_within_limit(current_words, " ", current_tokens, cache)
+            )
         
         return chunks
     
-    async def _apply_overlap(self, chunks: List[str]) -> List[str]:
+    async def _apply_overlap(self, chunks: List[str], cache: Dict[str, int]) -> List[str]:
         """Apply overlap between chunks"""
         if len(chunks) <= 1:
             return chunks
@@ -471,7 +732,7 @@ class DoclingDocumentProcessor(DocumentProcessor):
             
             # Get overlap from previous chunk
             prev_chunk = chunks[i - 1]
-            overlap_text = await self._get_overlap_text(prev_chunk, self.chunk_overlap)
+            overlap_text = await self._get_overlap_text(prev_chunk, self.chunk_overlap, cache)
             
             # Combine overlap with current chunk
             if overlap_text:
@@ -482,30 +743,96 @@ class DoclingDocumentProcessor(DocumentProcessor):
         
         return overlapped_chunks
     
-    async def _get_overlap_text(self, text: str, target_tokens: int) -> str:
+    async def _get_overlap_text(
+        self, text: str, target_tokens: int, cache: Dict[str, int]
+    ) -> str:
         """Get the last N tokens worth of text for overlap"""
         try:
-            # Split into words and work backwards
+            # Split into words once and accumulate per-word token counts
+            # from the tail instead of re-tokenizing the growing overlap
             words = text.split()
-            overlap_words = []
+            start = len(words)
             current_tokens = 0
             
-            for word in reversed(words):
-                test_text = " ".join([word] + overlap_words)
-                test_tokens = self.token_service.count_tokens(test_text)
-                
-                if test_tokens > target_tokens:
+            while start > 0:
+                word_tokens = self._count(words[start - 1], cache)
+                if current_tokens + word_tokens > target_tokens:
                     break
-                
-                overlap_words.insert(0, word)
-                current_tokens = test_tokens
+                current_tokens += word_tokens
+                start -= 1
             
-            return " ".join(overlap_words)
+            return " ".join(words[start:])
             
         except Exception as e:
-            self.logger.error(f"Failed to get overlap text: {str(e)}")
+            self.logger.error("Failed to get overlap text: %s", e)
             return ""
     
+    def _sliding_window_split(self, text: str) -> List[str]:
+        """Split text with one tokenizer pass and a fixed-size token window"""
+        try:
+            _, offsets = self.token_service.encode_with_offsets(text)
+        except Exception as e:
+            self.logger.error("Failed in sliding window split: %s", e)
+            return self._fallback_character_split(text)
+        
+        token_total = len(offsets)
+        if token_total <= self.chunk_size:
+            return [text] if text else []
+        
+        window = self.chunk_size
+        stride = self.chunk_size - self.chunk_overlap
+        window_count = math.ceil((token_total - window) / stride) + 1
+        
+        chunks = []
+        prev_end = 0
+        for i in range(window_count):
+            first = i * stride
+            last = min(first + window, token_total) - 1
+            start = offsets[first][0]
+            end = offsets[last][1]
+            
+            # Nudge boundaries onto paragraph/sentence breaks without leaving
+            # gaps: the end may not move before the next window's start and
+            # the start may not move past the previous chunk's end
+            if last < token_total - 1:
+                next_start = offsets[min(first + stride, token_total - 1)][0]
+                end = self._snap_end(text, max(start + 1, next_start), end)
+            if i > 0:
+                start = self._snap_start(text, start, prev_end)
+            
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+            prev_end = end
+        
+        return chunks
+    
+    def _snap_end(self, text: str, lower: int, end: int) -> int:
+        """Move a chunk end back to the nearest break within BOUNDARY_SNAP_CHARS"""
+        lower = max(lower, end - self.BOUNDARY_SNAP_CHARS)
+        if lower >= end:
+            return end
+        
+        idx = text.rfind("\n\n", lower, end)
+        if idx != -1:
+            return idx
+        idx = text.rfind(". ", lower, end)
+        if idx != -1:
+            return idx + 1
+        return end
+    
+    def _snap_start(self, text: str, start: int, upper: int) -> int:
+        """Move a chunk start forward to the nearest break within BOUNDARY_SNAP_CHARS"""
+        upper = min(upper, start + self.BOUNDARY_SNAP_CHARS)
+        if start >= upper or text.startswith(("\n\n", ". "), max(start - 2, 0)):
+            return start
+        
+        for separator in ("\n\n", ". "):
+            idx = text.find(separator, start, upper)
+            if idx != -1:
+                return idx + len(separator)
+        return start
+    
     def _fallback_character_split(self, text: str) -> List[str]:
         """Fallback method for splitting text by characters"""
         chunk_size_chars = self.chunk_size * 4  # Rough estimate: 1 token ≈ 4 chars
@@ -89,15 +89,15 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
     async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
         """Process a document and return token-based chunks and complete text"""
         try:
-            if document.document_type.value not in self.supported_types:
+            if document.document_type not in self.supported_types:
                 raise InvalidDocumentTypeError(
-                    f"Document type {document.document_type.value} not supported"
+                    f"Document type {document.document_type} not supported"
                 )
             
             self.logger.info(f"Starting text extraction for document {document.id}")
             
             # Use optimized extraction for PDFs
-            if document.document_type.value == "pdf" and self.use_direct_docling:
+            if document.document_type == "pdf" and self.use_direct_docling:
                 complete_text = await self._extract_text_with_docling(document.file_path)
             else:
                 complete_text = await self._extract_text_only(document.file_path)
@@ -182,7 +182,7 @@ class OptimizedSpacyLayoutProcessor(DocumentProcessor):
                     chunk_index=i,
                     metadata={
                         "document_filename": document.original_filename,
-                        "document_type": document.document_type.value,
+                        "document_type": document.document_type,
                         "chunk_token_count": token_count,
                         "chunk_char_count": len(chunk_text),
                         "processing_method": "optimized_token_chunking"
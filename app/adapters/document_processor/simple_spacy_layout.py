@@ -163,9 +163,9 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
     async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
         """Process a document and return token-based chunks and complete text"""
         try:
-            if document.document_type.value not in self.supported_types:
+            if document.document_type not in self.supported_types:
                 raise InvalidDocumentTypeError(
-                    f"Document type {document.document_type.value} not supported"
+                    f"Document type {document.document_type} not supported"
                 )
 
             self.logger.info(f"Starting text extraction for document {document.id}")
@@ -235,7 +235,7 @@ class SimpleSpacyLayoutProcessor(DocumentProcessor):
                     chunk_index=i,
                     metadata={
                         "document_filename": document.original_filename,
-                        "document_type": document.document_type.value,
+                        "document_type": document.document_type,
                         "chunk_token_count": token_count,
                         "chunk_char_count": len(chunk_text),
                         "processing_method": "simple_token_chunking"
@@ -74,15 +74,15 @@ class TextOnlyProcessor(DocumentProcessor):
     async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
         """Process a document and return token-based chunks and complete text"""
         try:
-            if document.document_type.value not in self.supported_types:
+            if document.document_type not in self.supported_types:
                 raise InvalidDocumentTypeError(
-                    f"Document type {document.document_type.value} not supported"
+                    f"Document type {document.document_type} not supported"
                 )
             
             self.logger.info(f"Starting fast text extraction for document {document.id}")
             
             # Use different extraction methods based on file type
-            if document.document_type.value == "pdf":
+            if document.document_type == "pdf":
                 complete_text = await self._extract_pdf_text_only(document.file_path)
             else:
                 complete_text = await self._extract_text_with_spacy_layout(document.file_path)
@@ -163,7 +163,7 @@ class TextOnlyProcessor(DocumentProcessor):
                     chunk_index=i,
                     metadata={
                         "document_filename": document.original_filename,
-                        "document_type": document.document_type.value,
+                        "document_type": document.document_type,
                         "chunk_token_count": token_count,
                         "chunk_char_count": len(chunk_text),
                         "processing_method": "simple_token_chunking"
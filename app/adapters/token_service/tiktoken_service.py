@@ -1,6 +1,6 @@
 import re
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from ...core.ports.token_service import TokenService, TokenInfo
 from ...core.domain.exceptions import TokenizationError
 
@@ -41,6 +41,19 @@ class TikTokenService(TokenService):
             # Fallback to character-based estimation
             return self.estimate_tokens_from_chars(len(text))
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for each text in a single tokenizer call"""
+        if not texts:
+            return []
+
+        try:
+            # encode_batch tokenizes on tiktoken's native thread pool
+            encoded = self.encoding.encode_batch(texts)
+            return [len(token_ids) if text.strip() else 0 for text, token_ids in zip(texts, encoded)]
+        except Exception as e:
+            logger.error(f"Error counting tokens in batch: {str(e)}")
+            return [self.count_tokens(text) for text in texts]
+
     def tokenize(self, text: str) -> TokenInfo:
         """Tokenize text and return detailed information"""
         if not text or not text.strip():
@@ -70,6 +83,20 @@ class TikTokenService(TokenService):
             logger.error(f"Error encoding text: {str(e)}")
             raise TokenizationError(f"Failed to encode text: {str(e)}")
 
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Encode text to token IDs with the (start, end) character span of each token"""
+        if not text:
+            return [], []
+
+        try:
+            token_ids = self.encoding.encode(text)
+            decoded, starts = self.encoding.decode_with_offsets(token_ids)
+            ends = starts[1:] + [len(decoded)]
+            return token_ids, list(zip(starts, ends))
+        except Exception as e:
+            logger.error(f"Error encoding text with offsets: {str(e)}")
+            raise TokenizationError(f"Failed to encode text with offsets: {str(e)}")
+
     def decode_tokens(self, token_ids: List[int]) -> str:
         """Decode token IDs back to text"""
         if not token_ids:
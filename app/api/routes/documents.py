@@ -1,14 +1,16 @@
-import shutil
+import asyncio
 import logging
 import traceback
+import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
+import aiofiles
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from ...config import settings
 from ...core.use_cases.process_document import ProcessDocumentUseCase
 from ...core.domain.entities.document import Document as DomainDocument
 from ...core.domain.entities.user import AuthenticatedUser
-from ...core.domain.value_objects.document_type import DocumentType
+from ...core.domain.value_objects.document_type import DocumentType, FILENAME_MAP
 from ...core.domain.exceptions import InvalidDocumentTypeError
 from ...api.deps import (
     get_document_processing_use_case,
@@ -17,26 +19,148 @@ from ...api.deps import (
 
 router = APIRouter()
 
+# Size of each read when streaming an upload to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# RAM-backed filesystem used for small uploads when RAMDISK_UPLOADS is on
+RAMDISK_DIR = Path("/dev/shm")
+
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Listed in the unsupported-extension error; built once rather than per rejected upload
+SUPPORTED_EXTENSIONS = ", ".join(sorted(FILENAME_MAP))
+
 
-def determine_document_type(filename: str) -> DocumentType:
+def determine_document_type(filename: str) -> str:
     """
     Determine document type from file extension using the DocumentType class method.
     Supports: PDF, DOCX, DOC, PPTX, HTML, MD
     """
     doc_type = DocumentType.from_filename(filename)
-    
+
     if doc_type == DocumentType.UNKNOWN:
-        supported_types = ", ".join(sorted(DocumentType.FILENAME_MAP.keys()))
         raise InvalidDocumentTypeError(
-            f"Unsupported file extension: {Path(filename).suffix}. Supported types: {supported_types}"
+            f"Unsupported file extension: {Path(filename).suffix}. Supported types: {SUPPORTED_EXTENSIONS}"
         )
-    
+
     return doc_type
 
 
+def _upload_dir(file: UploadFile) -> Path:
+    """
+    Pick the directory an upload is staged in until Docling reads it back.
+    Uploads that fit UPLOAD_MAX_PART_SIZE go to the RAM disk when enabled and present.
+    """
+    if (
+        settings.RAMDISK_UPLOADS
+        and file.size is not None
+        and file.size <= settings.UPLOAD_MAX_PART_SIZE
+        and RAMDISK_DIR.is_dir()
+    ):
+        return RAMDISK_DIR
+    return Path(settings.UPLOADS_DIR)
+
+
+def _check_upload_size(size: int, filename: str) -> None:
+    """Reject an upload larger than UPLOAD_MAX_FILE_SIZE, when that limit is set"""
+    limit = settings.UPLOAD_MAX_FILE_SIZE
+    if limit is not None and size > limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File {filename} exceeds the maximum upload size of {limit} bytes"
+        )
+
+
+async def _save_upload(file: UploadFile, doc_type: str, in_memory: bool) -> DomainDocument:
+    """
+    Stage an uploaded file and wrap it as a domain document.
+    Small uploads stay in memory when `in_memory` is set (the processor reads
+    Document.content); everything else is streamed to the staging directory.
+    """
+    new_id = str(uuid.uuid4())
+    ext = Path(file.filename).suffix.lower()
+    saved_filename = f"{new_id}{ext}"
+
+    if file.size is not None:
+        try:
+            _check_upload_size(file.size, file.filename)
+        except HTTPException:
+            await file.close()
+            raise
+
+    if in_memory and file.size is not None and file.size <= settings.IN_MEMORY_UPLOAD_MAX_SIZE:
+        try:
+            content = await file.read()
+        except Exception as e:
+            logger.error(f"Failed to read uploaded file: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to read uploaded file: {e}")
+        finally:
+            await file.close()
+
+        domain_doc = DomainDocument.create(
+            filename=saved_filename,
+            original_filename=file.filename,
+            file_path="",
+            file_size=len(content),
+            document_type=doc_type,
+            metadata={},
+            content=content
+        )
+        logger.info(f"Created in-memory domain document: {domain_doc.id}")
+        return domain_doc
+
+    collection_dir = _upload_dir(file)
+    collection_dir.mkdir(parents=True, exist_ok=True)
+    saved_path = collection_dir / saved_filename
+
+    # Stream uploaded file to disk without blocking the event loop; the size is
+    # re-checked as bytes arrive since the client may not have declared it
+    try:
+        written = 0
+        async with aiofiles.open(saved_path, "wb") as out_file:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                _check_upload_size(written, file.filename)
+                await out_file.write(chunk)
+        logger.info(f"File saved to: {saved_path}")
+    except HTTPException:
+        _remove_upload(saved_path)
+        raise
+    except Exception as e:
+        logger.error(f"Failed to save file: {e}")
+        _remove_upload(saved_path)
+        raise HTTPException(status_code=500, detail=f"Failed to save file: {e}")
+    finally:
+        await file.close()
+
+    # Create DomainDocument entity
+    file_stat = saved_path.stat()
+    domain_doc = DomainDocument.create(
+        filename=saved_filename,
+        original_filename=file.filename,
+        file_path=str(saved_path),
+        file_size=file_stat.st_size,
+        document_type=doc_type,
+        metadata={}
+    )
+    logger.info(f"Created domain document: {domain_doc.id}")
+    return domain_doc
+
+
+def _remove_upload(saved_path: Optional[Union[str, Path]]) -> None:
+    """Delete a saved upload, logging instead of raising on failure"""
+    if not saved_path:
+        return
+    saved_path = Path(saved_path)
+    if saved_path.exists():
+        try:
+            saved_path.unlink()
+            logger.info(f"Deleted uploaded file: {saved_path}")
+        except Exception as e:
+            logger.warning(f"Failed to delete uploaded file {saved_path}: {e}")
+
+
 @router.post("/upload")
 async def upload_document(
     file: UploadFile = File(...),
@@ -47,69 +171,59 @@ async def upload_document(
     if current_user:
         logger.info(f"Document upload by authenticated user: {current_user.id}")
 
-    saved_path = None
-    
+    domain_doc = None
+
     try:
-        # 2. Determine type
+        # Determine type
         try:
             doc_type = determine_document_type(file.filename)
         except InvalidDocumentTypeError as e:
             raise HTTPException(status_code=400, detail=str(e))
-        
-        uploads_base = Path(settings.UPLOADS_DIR)
-        collection_dir = uploads_base
-        collection_dir.mkdir(parents=True, exist_ok=True)
-        
-        import uuid
-        new_id = str(uuid.uuid4())
-        ext = Path(file.filename).suffix.lower()
-        saved_filename = f"{new_id}{ext}"
-        saved_path = collection_dir / saved_filename
-        
-        # Save uploaded file
-        try:
-            with open(saved_path, "wb") as out_file:
-                shutil.copyfileobj(file.file, out_file)
-            logger.info(f"File saved to: {saved_path}")
-        except Exception as e:
-            logger.error(f"Failed to save file: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to save file: {e}")
-        finally:
-            file.file.close()
-        
-        # 4. Create DomainDocument entity
-        file_stat = saved_path.stat()
-        domain_doc = DomainDocument.create(
-            filename=saved_filename,
-            original_filename=file.filename,
-            file_path=str(saved_path),
-            file_size=file_stat.st_size,
-            document_type=doc_type,
-            metadata={}
+
+        domain_doc = await _save_upload(
+            file, doc_type, document_use_case.document_processor.accepts_in_memory_content
         )
-        logger.info(f"Created domain document: {domain_doc.id}")
-        
+
         # Process the document
-        result = await document_use_case.document_processor.process_document(domain_doc)
-        
-        # Clean up the uploaded file after successful processing
-        if saved_path and saved_path.exists():
-            try:
-                saved_path.unlink()
-                logger.info(f"Successfully deleted uploaded file: {saved_path}")
-            except Exception as e:
-                logger.warning(f"Failed to delete uploaded file {saved_path}: {e}")
-        
-        return result
-        
-    except Exception as e:
-        # If processing fails, still try to clean up the file
-        if saved_path and saved_path.exists():
-            try:
-                saved_path.unlink()
-                logger.info(f"Cleaned up uploaded file after processing error: {saved_path}")
-            except Exception as cleanup_error:
-                logger.warning(f"Failed to cleanup file {saved_path} after error: {cleanup_error}")
-        
-        # Re-raise the original exception
-        raise
+        return await document_use_case.document_processor.process_document(domain_doc)
+
+    finally:
+        # Clean up the uploaded file whether or not processing succeeded
+        if domain_doc is not None:
+            _remove_upload(domain_doc.file_path)
+
+
+@router.post("/upload/batch")
+async def upload_documents(
+    files: List[UploadFile] = File(...),
+    document_use_case: ProcessDocumentUseCase = Depends(get_document_processing_use_case),
+    current_user: Optional[AuthenticatedUser] = Depends(authenticate_user)
+):
+    """Upload several documents and convert them in a single processor batch"""
+    if current_user:
+        logger.info(f"Batch upload of {len(files)} documents by authenticated user: {current_user.id}")
+
+    # Reject the whole batch before saving anything if a type is unsupported
+    try:
+        doc_types = [determine_document_type(file.filename) for file in files]
+    except InvalidDocumentTypeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    domain_docs: List[DomainDocument] = []
+    in_memory = document_use_case.document_processor.accepts_in_memory_content
+
+    try:
+        saved = await asyncio.gather(
+            *(_save_upload(file, doc_type, in_memory) for file, doc_type in zip(files, doc_types)),
+            return_exceptions=True
+        )
+        domain_docs = [doc for doc in saved if isinstance(doc, DomainDocument)]
+        errors = [error for error in saved if isinstance(error, BaseException)]
+        if errors:
+            raise errors[0]
+
+        return await document_use_case.document_processor.process_documents(domain_docs)
+
+    finally:
+        for domain_doc in domain_docs:
+            _remove_upload(domain_doc.file_path)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, SecretStr, field_validator
-from typing import Optional, List
+from typing import Literal, Optional, List
 from enum import Enum
 
 
@@ -87,6 +87,11 @@ class Settings(BaseSettings):
         env="DOCLING_MODEL_NAME",
         description="The docling name of the specific model to use."
     )
+    DOCLING_TEXT_FORMAT: Literal["text", "markdown"] = Field(
+        "text",
+        env="DOCLING_TEXT_FORMAT",
+        description="How complete_text and chunks are exported: plain text, or markdown with tables and headings rendered (the output before this setting existed)."
+    )
     
     # Performance
     max_concurrent_processes: int = 4
@@ -95,7 +100,9 @@ class Settings(BaseSettings):
     UPLOADS_DIR: Optional[str] = Field(default="data/uploads", env="UPLOADS_DIR", description="The directory to upload to.")
     UPLOAD_MAX_PART_SIZE: int = 50 * 1024 * 1024
     UPLOAD_MAX_FIELDS: Optional[int] = None
-    UPLOAD_MAX_FILE_SIZE: Optional[int] = None
+    UPLOAD_MAX_FILE_SIZE: Optional[int] = Field(None, env="UPLOAD_MAX_FILE_SIZE", description="Uploads larger than this many bytes are rejected with 413; unset allows any size.")
+    IN_MEMORY_UPLOAD_MAX_SIZE: int = Field(32 * 1024 * 1024, env="IN_MEMORY_UPLOAD_MAX_SIZE", description="Uploads up to this size are handed to Docling from memory without touching disk; 0 disables.")
+    RAMDISK_UPLOADS: bool = Field(False, env="RAMDISK_UPLOADS", description="Stage uploads up to UPLOAD_MAX_PART_SIZE in /dev/shm when available.")
     
     # API settings
     api_prefix: str = "/api/v1"
@@ -105,6 +112,7 @@ class Settings(BaseSettings):
     API_HOST: str = Field("0.0.0.0", env="API_HOST")
     API_PORT: int = Field(8000, env="API_PORT")
     DEBUG: bool = Field(False, env="DEBUG")
+    RADIX_ROUTER: bool = Field(False, env="RADIX_ROUTER", description="Match routes with fastapi-radixer's radix tree when the package is installed.")
 
 
 settings = Settings()
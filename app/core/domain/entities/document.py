@@ -14,9 +14,11 @@ class Document:
     original_filename: str = ""
     file_path: str = ""
     file_size: int = 0
-    document_type: DocumentType = DocumentType.UNKNOWN
+    document_type: str = DocumentType.UNKNOWN
     content_hash: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Raw bytes for uploads held in memory; file_path is empty when set
+    content: Optional[bytes] = field(default=None, repr=False)
     
     @classmethod
     def create(
@@ -25,9 +27,10 @@ class Document:
         original_filename: str,
         file_path: str,
         file_size: int,
-        document_type: DocumentType,
+        document_type: str,
         content_hash: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None
     ) -> "Document":
         return cls(
             filename=filename,
@@ -37,7 +40,8 @@ class Document:
             created_at=datetime.now(UTC),
             document_type=document_type,
             content_hash=content_hash,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            content=content
         )
     
     def update_metadata(self, key: str, value: Any) -> None:
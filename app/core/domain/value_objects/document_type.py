@@ -1,35 +1,43 @@
-from enum import Enum
-from pathlib import Path
+import sys
 from typing import ClassVar
 
 
-class DocumentType(str, Enum):
-    PDF = "pdf"
-    DOCX = "docx"
-    DOC = "doc"
-    MARKDOWN = "md"
-    HTML = "html"
-    PPTX = "pptx"
-    UNKNOWN = "unknown"
-    
+class DocumentType:
+    """
+    Document type constants.
+    Values are interned plain strings rather than Enum members, so comparing
+    and hashing them is a plain str operation on the upload path.
+    """
+    PDF: ClassVar[str] = sys.intern("pdf")
+    DOCX: ClassVar[str] = sys.intern("docx")
+    DOC: ClassVar[str] = sys.intern("doc")
+    MARKDOWN: ClassVar[str] = sys.intern("md")
+    HTML: ClassVar[str] = sys.intern("html")
+    PPTX: ClassVar[str] = sys.intern("pptx")
+    UNKNOWN: ClassVar[str] = sys.intern("unknown")
+
     @classmethod
-    def from_filename(cls, filename: str) -> "DocumentType":
+    def from_filename(cls, filename: str) -> str:
         """Determine document type from filename"""
-        ext = Path(filename).suffix.lower().lstrip(".")
-        return FILENAME_MAP.get(ext, cls.UNKNOWN)
-    
+        # Only the final extension matters, so skip building a Path. As with
+        # Path.suffix, a dot leading the last path component (".pdf") is no extension
+        dot = filename.rfind(".")
+        if dot <= filename.rfind("/") + 1:
+            return cls.UNKNOWN
+        return FILENAME_MAP.get(filename[dot + 1:].lower(), cls.UNKNOWN)
+
     @classmethod
-    def from_mime_type(cls, mime_type: str) -> "DocumentType":
+    def from_mime_type(cls, mime_type: str) -> str:
         """Determine document type from MIME type"""
         return MIME_TYPE_MAP.get(mime_type.lower(), cls.UNKNOWN)
-    
-    def get_mime_type(self) -> str:
-        """Get MIME type for document type"""
-        # Default to octet-stream for UNKNOWN type
-        return MIME_TYPE_INVERSE_MAP.get(self, "application/octet-stream")
+
+
+def _interned(mapping: dict[str, str]) -> dict[str, str]:
+    """Return a copy of mapping with sys.intern'd keys"""
+    return {sys.intern(key): value for key, value in mapping.items()}
 
 # File type map objects
-FILENAME_MAP: dict[str, DocumentType] = {
+FILENAME_MAP: dict[str, str] = _interned({
     "pdf": DocumentType.PDF,
     "docx": DocumentType.DOCX,
     "doc": DocumentType.DOC,
@@ -38,9 +46,9 @@ FILENAME_MAP: dict[str, DocumentType] = {
     "htm": DocumentType.HTML,
     "pptx": DocumentType.PPTX,
     "ppt": DocumentType.PPTX,
-}
+})
 
-MIME_TYPE_MAP: dict[str, DocumentType] = {
+MIME_TYPE_MAP: dict[str, str] = _interned({
     "application/pdf": DocumentType.PDF,
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document": DocumentType.DOCX,
     "application/msword": DocumentType.DOC,
@@ -48,9 +56,9 @@ MIME_TYPE_MAP: dict[str, DocumentType] = {
     "text/html": DocumentType.HTML,
     "application/vnd.openxmlformats-officedocument.presentationml.presentation": DocumentType.PPTX,
     "application/vnd.ms-powerpoint": DocumentType.PPTX,
-}
+})
 
-MIME_TYPE_INVERSE_MAP: dict[DocumentType, str] = {
+MIME_TYPE_INVERSE_MAP: dict[str, str] = {
     DocumentType.PDF: "application/pdf",
     DocumentType.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     DocumentType.DOC: "application/msword",
@@ -58,3 +66,9 @@ MIME_TYPE_INVERSE_MAP: dict[DocumentType, str] = {
     DocumentType.HTML: "text/html",
     DocumentType.PPTX: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
 }
+
+
+def get_mime_type(document_type: str) -> str:
+    """Get MIME type for document type"""
+    # Default to octet-stream for UNKNOWN type
+    return MIME_TYPE_INVERSE_MAP.get(document_type, "application/octet-stream")
@@ -7,6 +7,10 @@ from ..domain.entities.document_chunk import DocumentChunk
 class DocumentProcessor(ABC):
     """Port for document processing services"""
 
+    # Whether process_document reads Document.content when file_path is empty;
+    # uploads are only kept in memory for processors that set this
+    accepts_in_memory_content: bool = False
+
     @abstractmethod
     async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
         """
@@ -21,6 +25,23 @@ class DocumentProcessor(ABC):
         """
         pass
 
+    async def process_documents(
+        self, documents: List[Document]
+    ) -> List[Tuple[List[DocumentChunk], str]]:
+        """
+        Process several documents.
+
+        Implementations that can convert in bulk should override this;
+        the default processes the documents one at a time.
+
+        Args:
+            documents: Document entities to process
+
+        Returns:
+            One (chunks, complete text) pair per document, in input order
+        """
+        return [await self.process_document(document) for document in documents]
+
     @abstractmethod
     def get_supported_types(self) -> List[str]:
         """Return list of supported document types"""
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from ..domain.exceptions import TokenizationError
+
 
 @dataclass
 class TokenInfo:
@@ -19,6 +21,10 @@ class TokenService(ABC):
         """Count tokens in text"""
         pass
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for each text; implementations may override with a single batched call"""
+        return [self.count_tokens(text) for text in texts]
+
     @abstractmethod
     def tokenize(self, text: str) -> TokenInfo:
         """Tokenize text and return detailed information"""
@@ -29,6 +35,12 @@ class TokenService(ABC):
         """Encode text to token IDs"""
         pass
 
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Encode text to token IDs with the (start, end) character span of each token"""
+        raise TokenizationError(
+            f"{type(self).__name__} does not provide token character offsets"
+        )
+
     @abstractmethod
     def decode_tokens(self, token_ids: List[int]) -> str:
         """Decode token IDs back to text"""
@@ -1,32 +1,86 @@
 import os
+import re
+import functools
 import logging
 import asyncio
-import uvicorn
-import logging
-from pathlib import Path
-from fastapi import FastAPI, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 # Import our middleware
 from fastapi.middleware.cors import CORSMiddleware
-from .infrastructure.multipart_limit_middleware import MultipartLimitMiddleware
 from .infrastructure.logging import setup_logging, RequestLoggingMiddleware
 from .infrastructure.metrics import PrometheusMiddleware, metrics_endpoint
 from .config import settings
-# Import adapter classes
-from .adapters.token_service.tiktoken_service import TikTokenService
-# from .adapters.document_processor.simple_spacy_layout import SimpleSpacyLayoutProcessor
-from .adapters.document_processor.docling_document_processor import DoclingDocumentProcessor
-from .adapters.auth_service.simple_auth_service import SimpleAuthService
+# Adapter classes are imported in lifespan so importing the app stays cheap
 # Imports for routers
 from .api.routes.documents import router as documents_router
 
+@functools.cache
+def get_token_service():
+    """Build the shared tokenizer on first use"""
+    from .adapters.token_service.tiktoken_service import TikTokenService
+    return TikTokenService()
+
+def _build_document_processor():
+    """Build the document processor together with its tokenizer"""
+    from .adapters.document_processor.docling_document_processor import DoclingDocumentProcessor
+    # from .adapters.document_processor.simple_spacy_layout import SimpleSpacyLayoutProcessor
+    # return SimpleSpacyLayoutProcessor(
+    #     spacy_model=settings.spacy_model,
+    #     token_service=get_token_service(),
+    # )
+    return DoclingDocumentProcessor(
+        token_service=get_token_service(),
+        text_format=settings.DOCLING_TEXT_FORMAT,
+    )
+
+# Instantiate singleton adapter instances in app.state for the app's lifetime
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Application startup: instantiating adapters...")
+    os.makedirs(settings.UPLOADS_DIR, exist_ok=True)
+    
+    try:
+        from .adapters.auth_service.simple_auth_service import SimpleAuthService
+        
+        # Reveal each secret once; either may be unset when that auth method is unused
+        auth_api_key = settings.auth_api_key
+        jwt_secret = settings.jwt_secret
+        api_key_value = auth_api_key.get_secret_value() if auth_api_key else None
+        jwt_secret_value = jwt_secret.get_secret_value() if jwt_secret else None
+        
+        # Build the auth service and the document processor in worker threads so
+        # tokenizer and Docling converter setup overlap
+        auth_service, document_processor = await asyncio.gather(
+            asyncio.to_thread(
+                SimpleAuthService,
+                api_key=api_key_value,
+                jwt_secret=jwt_secret_value,
+            ),
+            asyncio.to_thread(_build_document_processor),
+        )
+        app.state.auth_service = auth_service
+        app.state.document_processor = document_processor
+        
+        logger.info("Startup complete: adapters instantiated successfully")
+    except Exception as e:
+        logger.error("Failed to initialize adapters: %s", e)
+        raise  # This will prevent the application from starting
+    
+    yield
+    
+    logger.info("Application shutdown: closing resources...")
+    logger.info("Shutdown complete.")
+
 app = FastAPI(
     title="BrainDrive Document Processing AI",
     description="Standalone document processing service for BrainDrive",
     version="0.1.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan,
+    # Serialize JSON responses with orjson; /metrics returns its own plain-text Response
+    default_response_class=ORJSONResponse
 )
 
 # Setup logging early
@@ -39,12 +93,23 @@ app.add_middleware(RequestLoggingMiddleware)
 # Add Prometheus metrics middleware
 app.add_middleware(PrometheusMiddleware)
 
+def _compile_origin_regex(origin_regex):
+    """Compile the CORS origin regex once, disabling it if it is invalid."""
+    try:
+        compiled = re.compile(origin_regex, re.ASCII)
+    except re.error as e:
+        logger.error("Invalid CORS origin regex %r, ignoring it: %s", origin_regex, e)
+        return None
+    logger.info("CORS origin regex: %s", compiled.pattern)
+    return compiled
+
+@functools.lru_cache(maxsize=1)
 def build_cors_config():
     """Build CORS settings; default is wide open for local testing."""
     allow_any = os.getenv("CORS_ALLOW_ANY", "1").lower() in ("1", "true", "yes", "on")
     if allow_any:
         # Reflect any origin (no hardcoded hosts) while allowing credentials
-        return [], ".*", True
+        return (), _compile_origin_regex(".*"), True
 
     default_origins = [
         "http://localhost:5173",
@@ -63,13 +128,14 @@ def build_cors_config():
 
     origin_regex = os.getenv(
         "CORS_ORIGIN_REGEX",
-        r"https?://(localhost|127\\.0\\.0\\.1|10\\.\d+\\.\d+\\.\d+|192\\.168\\.\d+\\.\d+|172\\.(1[6-9]|2\\d|3[0-1])\\.\d+\\.\d+)(:\\d+)?$",
+        r"https?://(localhost|127\.0\.0\.1|10\.\d+\.\d+\.\d+|192\.168\.\d+\.\d+|172\.(1[6-9]|2\d|3[0-1])\.\d+\.\d+)(:\d+)?$",
     )
 
     allow_credentials = os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() in ("1", "true", "yes", "on")
 
-    unique_origins = list(dict.fromkeys(default_origins))
-    return unique_origins, origin_regex, allow_credentials
+    # Tuple so the cached result cannot be mutated by callers
+    unique_origins = tuple(dict.fromkeys(default_origins))
+    return unique_origins, _compile_origin_regex(origin_regex), allow_credentials
 
 # CORS (if frontend served separately)
 cors_origins, cors_origin_regex, cors_allow_credentials = build_cors_config()
@@ -82,18 +148,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Static payloads for /health and /, serialized once rather than per probe
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "BrainDrive Document AI",
+    "version": "0.1.0"
+})
+_ROOT_BYTES = orjson.dumps({
+    "message": "BrainDrive Document Processing AI",
+    "version": "0.1.0",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "metrics": "/metrics",
+        "docs": "/docs",
+        "upload": "/documents/upload"
+    }
+})
+
 # Health check endpoint for Cloud Run
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Google Cloud Run"""
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "healthy",
-            "service": "BrainDrive Document AI",
-            "version": "0.1.0"
-        }
-    )
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # Include metrics endpoint
 @app.get("/metrics")
@@ -103,54 +180,20 @@ async def metrics():
 # Root endpoint
 @app.get("/")
 async def root():
-    return {
-        "message": "BrainDrive Document Processing AI",
-        "version": "0.1.0",
-        "status": "running",
-        "endpoints": {
-            "health": "/health",
-            "metrics": "/metrics",
-            "docs": "/docs",
-            "upload": "/documents/upload"
-        }
-    }
-
-# On startup, instantiate and store singleton adapter instances in app.state
-@app.on_event("startup")
-async def on_startup():
-    logger.info("Application startup: instantiating adapters...")
-    os.makedirs(settings.UPLOADS_DIR, exist_ok=True)
-    
-    try:
-        # Auth service
-        app.state.auth_service = SimpleAuthService(
-            api_key=settings.auth_api_key.get_secret_value(),
-            jwt_secret=settings.jwt_secret.get_secret_value(),
-        )
-        # Token service
-        token_service = TikTokenService()
-        
-        # Document processor - this will fail fast if spaCy model is not available
-        # app.state.document_processor = SimpleSpacyLayoutProcessor(
-        #     spacy_model=settings.spacy_model,
-        #     token_service=token_service,
-        # )
-        app.state.document_processor = DoclingDocumentProcessor(
-            token_service=token_service,
-        )
-        
-        logger.info("Startup complete: adapters instantiated successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize adapters: {e}")
-        raise  # This will prevent the application from starting
-
-@app.on_event("shutdown")
-async def on_shutdown():
-    logger.info("Application shutdown: closing resources...")
-    logger.info("Shutdown complete.")
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 app.include_router(
     documents_router,
     prefix="/documents",
     tags=["documents"]
 )
+
+# Optional radix-tree route matching; must run after every router is included
+if settings.RADIX_ROUTER:
+    try:
+        from fastapi_radixer import init_app as init_radix_router
+    except ImportError:
+        logger.warning("RADIX_ROUTER is set but fastapi-radixer is not installed; using the default router")
+    else:
+        init_radix_router(app)
+        logger.info("Radix-tree router enabled")
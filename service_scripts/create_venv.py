@@ -17,15 +17,12 @@ import subprocess
 import sys
 from pathlib import Path
 
-from venv_utils import DEFAULT_VENV_DIR, REPO_ROOT, find_python, venv_exists, venv_python
+from venv_utils import clear_venv_cache, default_venv_dir, env_flag, find_python, repo_root, venv_exists, venv_python
 
 
 def main() -> None:
-    venv_dir = Path(os.environ.get("VENV_PATH", DEFAULT_VENV_DIR))
-    force_recreate = (
-        os.environ.get("VENV_FORCE_RECREATE", "").lower() in {"1", "true", "yes", "on"}
-        or "--wipe" in sys.argv
-    )
+    venv_dir = Path(os.environ.get("VENV_PATH") or default_venv_dir())
+    force_recreate = env_flag("VENV_FORCE_RECREATE") or "--wipe" in sys.argv
 
     if venv_exists(venv_dir):
         if force_recreate:
@@ -37,11 +34,12 @@ def main() -> None:
 
     python_bin = find_python()
     print(f"Creating venv at {venv_dir} with {python_bin}")
-    subprocess.check_call([python_bin, "-m", "venv", str(venv_dir)], cwd=REPO_ROOT)
+    subprocess.check_call([python_bin, "-m", "venv", str(venv_dir)], cwd=repo_root())
+    clear_venv_cache()
 
-    # Upgrade core tooling inside the venv for smoother installs.
+    # Upgrade core tooling inside the venv for smoother installs; uv speeds up install_with_venv.py.
     venv_py = venv_python(venv_dir)
-    subprocess.check_call([str(venv_py), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"], cwd=REPO_ROOT)
+    subprocess.check_call([str(venv_py), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel", "uv"], cwd=repo_root())
 
     print(f"Done. Activate with: source {venv_dir}/bin/activate (Linux/macOS) or {venv_dir}\\Scripts\\activate (Windows)")
 
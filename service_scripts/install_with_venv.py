@@ -10,71 +10,113 @@ Environment overrides:
 """
 from __future__ import annotations
 
+import importlib
 import os
 import subprocess
 import sys
 import time
 from pathlib import Path
+from importlib import metadata
+from typing import Optional, Tuple
 
 DEFAULT_DOCLING_MODEL = "ds4sd/docling-layout-heron"
+# Oldest pip trusted to resolve requirements.txt; older venvs are upgraded in the same install call
+MIN_PIP_VERSION = (23, 0)
 
 
-def _parse_env_file(path: Path) -> dict:
+def _unquote(value: str) -> str:
+    """Drop one pair of matching surrounding quotes, leaving inner quotes alone."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] in "\"'" and value[-1] == value[0]:
+        return value[1:-1]
+    return value
+
+
+def _read_env_value(path: Path, key: str) -> Optional[str]:
+    """
+    Return a single key from a dotenv file.
+    Uses python-dotenv when importable; otherwise scans lines and stops at the first match.
+    """
     if not path.exists():
-        return {}
-    values: dict = {}
+        return None
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        dotenv_values = None
+    if dotenv_values is not None:
+        return dotenv_values(path).get(key)
+
     for raw_line in path.read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        if not key:
-            continue
-        values[key] = value.strip().strip('"').strip("'")
-    return values
+        name, value = line.split("=", 1)
+        if name.strip() == key:
+            return _unquote(value)
+    return None
 
 
 def _resolve_docling_model_name() -> str:
     env_name = os.environ.get("DOCLING_MODEL_NAME")
     if env_name:
         return env_name
-    env_path = REPO_ROOT / ".env"
-    env_values = _parse_env_file(env_path)
-    if env_values.get("DOCLING_MODEL_NAME"):
-        return env_values["DOCLING_MODEL_NAME"]
-    fallback_env = REPO_ROOT / ".env.local.example"
-    env_values = _parse_env_file(fallback_env)
-    if env_values.get("DOCLING_MODEL_NAME"):
-        return env_values["DOCLING_MODEL_NAME"]
+    root = repo_root()
+    for env_path in (root / ".env", root / ".env.local.example"):
+        model_name = _read_env_value(env_path, "DOCLING_MODEL_NAME")
+        if model_name:
+            return model_name
     return DEFAULT_DOCLING_MODEL
 
 
-def _preload_docling_model_windows(venv_py: Path) -> None:
-    if os.name != "nt":
-        return
+def _preload_docling_model(venv_py: Path, venv_dir: Path) -> None:
+    """
+    Download the Docling model into the Hugging Face cache now so the first
+    upload after startup does not wait on it.
+    """
     model_name = _resolve_docling_model_name()
     if not model_name:
         return
+    hf_env = {
+        # hf_transfer (installed from requirements.txt) parallelizes the download
+        "HF_HUB_ENABLE_HF_TRANSFER": "1",
+    }
+    if os.name == "nt":
+        hf_env["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
+        hf_env["HF_HUB_DISABLE_SYMLINKS"] = "1"
+
+    print(f"Preloading Docling model: {model_name}")
+
+    # Running from the target venv: download in this process instead of starting another python
+    if Path(sys.prefix).resolve() == venv_dir.resolve():
+        for key, value in hf_env.items():
+            os.environ.setdefault(key, value)
+        importlib.invalidate_caches()  # pick up packages installed after this script started
+        try:
+            from huggingface_hub import snapshot_download
+
+            snapshot_download(model_name, local_dir_use_symlinks=False, max_workers=8)
+        except Exception as exc:
+            print(f"Warning: Docling model preload failed (will retry at runtime): {exc}")
+        return
+
     env = os.environ.copy()
-    env.setdefault("HF_HUB_DISABLE_SYMLINKS_WARNING", "1")
-    env.setdefault("HF_HUB_DISABLE_SYMLINKS", "1")
+    for key, value in hf_env.items():
+        env.setdefault(key, value)
     cmd = [
         str(venv_py),
         "-c",
         (
             "from huggingface_hub import snapshot_download;"
-            "snapshot_download(%r, local_dir_use_symlinks=False)"
+            "snapshot_download(%r, local_dir_use_symlinks=False, max_workers=8)"
         )
         % model_name,
     ]
     try:
-        print(f"Preloading Docling model on Windows: {model_name}")
-        subprocess.check_call(cmd, cwd=REPO_ROOT, env=env)
+        subprocess.check_call(cmd, cwd=repo_root(), env=env)
     except subprocess.CalledProcessError as exc:
         print(f"Warning: Docling model preload failed (will retry at runtime): {exc}")
 
-from venv_utils import DEFAULT_VENV_DIR, REPO_ROOT, venv_exists, venv_python
+from venv_utils import default_venv_dir, repo_root, venv_exists, venv_python
 
 
 def _pip_env() -> dict:
@@ -83,12 +125,69 @@ def _pip_env() -> dict:
     return env
 
 
-def _install_requirements(venv_py: Path, requirements: Path, torch_index: str) -> None:
+def _venv_pip_version(venv_dir: Path) -> Optional[Tuple[int, ...]]:
+    """
+    Read the venv's pip version from its site-packages metadata without starting the venv python.
+    """
+    if os.name == "nt":
+        site_dirs = [venv_dir / "Lib" / "site-packages"]
+    else:
+        site_dirs = sorted(venv_dir.glob("lib/python*/site-packages"))
+    for dist in metadata.distributions(path=[str(path) for path in site_dirs]):
+        if (dist.metadata["Name"] or "").lower() == "pip":
+            parts = []
+            for part in dist.version.split("."):
+                if not part.isdigit():
+                    break
+                parts.append(int(part))
+            return tuple(parts)
+    return None
+
+
+def _install_with_uv(venv_py: Path, requirements: Path, torch_index: str) -> bool:
+    """
+    Install requirements with uv's parallel resolver/downloader when the venv has it.
+    Returns False so the caller falls back to pip when uv is missing or fails.
+    """
+    cmd = [
+        str(venv_py),
+        "-m",
+        "uv",
+        "pip",
+        "install",
+        "--python",
+        str(venv_py),
+        "-r",
+        str(requirements),
+        # Let the CPU torch index and PyPI both satisfy a package, as pip does
+        "--index-strategy",
+        "unsafe-best-match",
+        "--extra-index-url",
+        torch_index,
+    ]
+    if os.name == "nt":
+        # Copy instead of hardlinking from the uv cache to avoid Windows file locks
+        cmd.append("--link-mode=copy")
+    try:
+        subprocess.check_call(cmd, cwd=repo_root(), env=_pip_env())
+        return True
+    except (OSError, subprocess.CalledProcessError) as exc:
+        print(f"uv install unavailable or failed ({exc}); falling back to pip.")
+        return False
+
+
+def _install_requirements(venv_py: Path, requirements: Path, torch_index: str, upgrade_pip: bool = False) -> None:
+    if _install_with_uv(venv_py, requirements, torch_index):
+        return
+
+    # Fold the pip upgrade into the requirements install rather than a separate pip run
+    pip_upgrade = ["--upgrade", "pip"] if upgrade_pip else []
     base_cmd = [
         str(venv_py),
         "-m",
         "pip",
         "install",
+        *pip_upgrade,
         "-r",
         str(requirements),
         "--extra-index-url",
@@ -99,7 +198,7 @@ def _install_requirements(venv_py: Path, requirements: Path, torch_index: str) -
     env = _pip_env()
     for attempt in range(1, attempts + 1):
         try:
-            subprocess.check_call(base_cmd, cwd=REPO_ROOT, env=env)
+            subprocess.check_call(base_cmd, cwd=repo_root(), env=env)
             return
         except subprocess.CalledProcessError:
             if attempt >= attempts:
@@ -112,6 +211,7 @@ def _install_requirements(venv_py: Path, requirements: Path, torch_index: str) -
                 "pip",
                 "install",
                 "--no-cache-dir",
+                *pip_upgrade,
                 "-r",
                 str(requirements),
                 "--extra-index-url",
@@ -120,27 +220,24 @@ def _install_requirements(venv_py: Path, requirements: Path, torch_index: str) -
 
 
 def main() -> None:
-    venv_dir = Path(os.environ.get("VENV_PATH", DEFAULT_VENV_DIR))
+    venv_dir = Path(os.environ.get("VENV_PATH") or default_venv_dir())
     if not venv_exists(venv_dir):
         sys.exit(f"Venv not found at {venv_dir}. Run tests/create_venv.py first.")
 
-    requirements = REPO_ROOT / "requirements.txt"
+    requirements = repo_root() / "requirements.txt"
     if not requirements.exists():
         sys.exit(f"requirements.txt not found at {requirements}")
 
     venv_py = venv_python(venv_dir)
 
-    subprocess.check_call(
-        [str(venv_py), "-m", "pip", "install", "--upgrade", "pip"],
-        cwd=REPO_ROOT,
-        env=_pip_env(),
-    )
+    pip_version = _venv_pip_version(venv_dir)
+    upgrade_pip = pip_version is None or pip_version < MIN_PIP_VERSION
 
     # Use PyTorch CPU wheels index to avoid pulling CUDA dependencies by default.
     torch_index = "https://download.pytorch.org/whl/cpu"
-    _install_requirements(venv_py, requirements, torch_index)
+    _install_requirements(venv_py, requirements, torch_index, upgrade_pip=upgrade_pip)
 
-    _preload_docling_model_windows(venv_py)
+    _preload_docling_model(venv_py, venv_dir)
 
     print("\nDependencies installed into the venv.")
 
@@ -19,30 +19,43 @@ import sys
 import time
 from pathlib import Path
 
-from venv_utils import DEFAULT_VENV_DIR, REPO_ROOT, venv_exists
+from venv_utils import default_venv_dir, repo_root, venv_exists
 
 import shutdown_with_venv
 
 
+# Set once .env has been applied in this process, so repeated loads skip the file.
+# Kept out of os.environ: the service and later restarts launched from its
+# environment must still read .env themselves.
+_dotenv_loaded = False
+
+
 def _load_env_file() -> None:
     """
     Load the .env file so host/port or other env-based settings are picked up on restart.
+    Variables already set in the environment win over the file.
     """
-    dotenv_path = REPO_ROOT / ".env"
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    dotenv_path = repo_root() / ".env"
     if not dotenv_path.exists():
         return
     try:
-        from dotenv import load_dotenv
+        from dotenv import dotenv_values
     except ImportError:
         print("python-dotenv is not installed; skipping .env reload.")
         return
 
-    load_dotenv(dotenv_path, override=False)
+    for key, value in dotenv_values(dotenv_path).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    _dotenv_loaded = True
     print(f"Loaded environment variables from {dotenv_path}")
 
 
 def main() -> None:
-    venv_dir = Path(os.environ.get("VENV_PATH", DEFAULT_VENV_DIR))
+    venv_dir = Path(os.environ.get("VENV_PATH") or default_venv_dir())
     if not venv_exists(venv_dir):
         sys.exit(f"Venv not found at {venv_dir}. Run service_scripts/create_venv.py first.")
 
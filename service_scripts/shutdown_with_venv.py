@@ -12,20 +12,65 @@ Environment overrides:
 """
 from __future__ import annotations
 
+import functools
 import os
+import re
+import shutil
+import subprocess
 import sys
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import psutil
 
-from venv_utils import REPO_ROOT
+from venv_utils import repo_root
 
-DEFAULT_PIDFILE = REPO_ROOT / "data" / "service.pid"
 DEFAULT_PROCESS_MARKERS = ["uvicorn", "app.main:app"]
 DEFAULT_SHUTDOWN_TIMEOUT = 15.0
 
 
+def default_pidfile() -> Path:
+    """
+    Default pidfile location (data/service.pid under the repo root).
+    """
+    return repo_root() / "data" / "service.pid"
+
+
+@functools.cache
+def _repo_fragment() -> str:
+    """
+    Lowercased repo path looked for in process command lines.
+    """
+    return str(repo_root()).lower()
+
+
+# One compiled alternation per marker list, so each process is matched in a single search
+_MARKER_RE_CACHE: Dict[tuple, "re.Pattern[str]"] = {}
+
+
+def _marker_pattern(markers: Iterable[str]) -> "re.Pattern[str]":
+    key = tuple(markers)
+    pattern = _MARKER_RE_CACHE.get(key)
+    if pattern is None:
+        pattern = re.compile("|".join(re.escape(marker) for marker in key))
+        _MARKER_RE_CACHE[key] = pattern
+    return pattern
+
+
+@functools.lru_cache(maxsize=1024)
+def _cwd_in_repo(cwd: str) -> bool:
+    """
+    Whether a working directory lies inside the repo, resolving each distinct cwd once.
+    Many processes share a cwd, so this saves a realpath() per process.
+    """
+    try:
+        cwd_path = Path(cwd).resolve()
+    except (OSError, RuntimeError):
+        return False
+    root = repo_root()  # already resolved
+    return cwd_path == root or root in cwd_path.parents
+
+
 def parse_markers(raw: Optional[str]) -> List[str]:
     """
     Split a comma/semicolon separated list of match tokens, falling back to defaults.
@@ -37,12 +82,14 @@ def parse_markers(raw: Optional[str]) -> List[str]:
     return DEFAULT_PROCESS_MARKERS
 
 
-def pidfile_from_env(default: Path = DEFAULT_PIDFILE) -> Path:
+def pidfile_from_env(default: Optional[Path] = None) -> Path:
     """
     Resolve the pidfile path from environment variables.
     """
     raw = os.environ.get("PIDFILE") or os.environ.get("PID_FILE")
-    return Path(raw) if raw else default
+    if raw:
+        return Path(raw)
+    return default if default is not None else default_pidfile()
 
 
 def parse_timeout(raw: Optional[str], default: float) -> float:
@@ -57,43 +104,62 @@ def parse_timeout(raw: Optional[str], default: float) -> float:
         return default
 
 
-def _is_service_process(proc: psutil.Process, markers: Iterable[str]) -> bool:
+def _is_service_process(
+    proc: psutil.Process, markers: Iterable[str], info: Optional[Dict[str, Any]] = None
+) -> bool:
     """
     Ensure we only kill a process that looks like this service.
+    `info` is the attribute dict prefetched by psutil.process_iter; attributes
+    it does not carry, or left as None because access was denied, are read
+    from the live process so those errors still reject the process.
     """
+    info = info or {}
     try:
-        name = proc.name()
-        cmdline_parts = proc.cmdline()
-        cwd = proc.cwd()
+        name = info.get("name")
+        if name is None:
+            name = proc.name()
+        cmdline_parts = info.get("cmdline")
+        if cmdline_parts is None:
+            cmdline_parts = proc.cmdline()
+        cwd = info.get("cwd")
+        if cwd is None:
+            cwd = proc.cwd()
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
         return False
 
-    cmdline = " ".join(cmdline_parts).lower()
+    cmdline = " ".join(cmdline_parts or []).lower()
     lower_name = name.lower() if name else ""
-    repo_fragment = str(REPO_ROOT).lower()
 
-    marker_match = any(marker in cmdline or marker in lower_name for marker in markers)
-    cwd_match = False
-    if cwd:
-        try:
-            cwd_path = Path(cwd).resolve()
-            cwd_match = cwd_path == REPO_ROOT or REPO_ROOT in cwd_path.parents
-        except (OSError, RuntimeError):
-            pass
-    return marker_match and (cwd_match or repo_fragment in cmdline)
+    pattern = _marker_pattern(markers)
+    marker_match = bool(pattern.search(cmdline) or pattern.search(lower_name))
+    cwd_match = bool(cwd) and _cwd_in_repo(cwd)
+    return marker_match and (cwd_match or _repo_fragment() in cmdline)
 
 
 def _terminate_process(proc: psutil.Process, timeout: float) -> bool:
     """
     Terminate a process (and any children) with a grace period before killing.
+    Uvicorn forwards SIGTERM to its workers, so the parent is signalled alone first;
+    the process tree is only walked if it is still running after most of the grace period.
     """
+    try:
+        proc.terminate()
+    except psutil.NoSuchProcess:
+        return True
+    except psutil.AccessDenied:
+        print(f"Permission denied when terminating PID {proc.pid}")
+        return False
+
+    _, alive = psutil.wait_procs([proc], timeout=timeout * 0.7)
+    if not alive:
+        return True
+
     try:
         children = proc.children(recursive=True)
     except psutil.Error:
         children = []
 
-    targets = [proc] + children
-    for target in targets:
+    for target in children:
         try:
             target.terminate()
         except psutil.NoSuchProcess:
@@ -102,7 +168,8 @@ def _terminate_process(proc: psutil.Process, timeout: float) -> bool:
             print(f"Permission denied when terminating PID {target.pid}")
             return False
 
-    gone, alive = psutil.wait_procs(targets, timeout=timeout)
+    targets = [proc] + children
+    gone, alive = psutil.wait_procs(targets, timeout=timeout * 0.3)
     if alive:
         for target in alive:
             try:
@@ -141,12 +208,62 @@ def _stop_with_pidfile(pidfile: Path, markers: Iterable[str], timeout: float) ->
     return success
 
 
+# Characters with special meaning in a POSIX extended regular expression
+_ERE_SPECIAL = frozenset(".[]()*+?{}|^$\\")
+
+
+def _ere_escape(text: str) -> str:
+    """
+    Escape text for pgrep's POSIX ERE syntax; re.escape also escapes characters
+    such as '-' and spaces, which POSIX leaves undefined.
+    """
+    return "".join("\\" + char if char in _ERE_SPECIAL else char for char in text)
+
+
+def _pgrep_candidates(markers: Iterable[str]) -> Optional[List[int]]:
+    """
+    Ask pgrep for PIDs whose command line mentions a marker.
+    Returns None when pgrep is unavailable, fails or matches nothing, so the
+    caller scans the process table instead.
+    """
+    if os.name != "posix":
+        return None
+    pgrep = shutil.which("pgrep")
+    if not pgrep:
+        return None
+    pattern = "|".join(_ere_escape(marker) for marker in markers)
+    try:
+        result = subprocess.run([pgrep, "-f", "-i", pattern], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # Exit status 1 means no process matched and anything above that is an error;
+    # neither is trusted over a full scan
+    if result.returncode != 0:
+        return None
+    pids = [int(pid) for pid in result.stdout.split() if pid.isdigit()]
+    return pids or None
+
+
 def _find_processes(markers: Iterable[str]) -> List[psutil.Process]:
     matches: List[psutil.Process] = []
+    candidates = _pgrep_candidates(markers)
+    if candidates is not None:
+        # pgrep only narrows the search; every candidate still passes the same safety check
+        for pid in candidates:
+            if pid == os.getpid():
+                continue
+            try:
+                proc = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                continue
+            if _is_service_process(proc, markers):
+                matches.append(proc)
+        return matches
+
     for proc in psutil.process_iter(["pid", "name", "cmdline", "cwd"]):
         if proc.pid == os.getpid():
             continue
-        if _is_service_process(proc, markers):
+        if _is_service_process(proc, markers, proc.info):
             matches.append(proc)
     return matches
 
@@ -176,7 +293,7 @@ def shutdown(pidfile: Optional[Path] = None, process_markers: Optional[Iterable[
     Attempt to stop the service using a pidfile first, falling back to a safe process search.
     """
     markers = [marker.lower() for marker in process_markers] if process_markers else DEFAULT_PROCESS_MARKERS
-    pid_path = pidfile if pidfile is not None else DEFAULT_PIDFILE
+    pid_path = pidfile if pidfile is not None else default_pidfile()
 
     stopped = _stop_with_pidfile(pid_path, markers, timeout)
     if not stopped:
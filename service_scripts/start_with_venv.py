@@ -14,51 +14,55 @@ Environment overrides:
 from __future__ import annotations
 
 import os
-import signal
-import shutil
-import subprocess
 import sys
 from pathlib import Path
 
-from venv_utils import DEFAULT_VENV_DIR, REPO_ROOT, venv_exists, venv_python
+from venv_utils import default_venv_dir, env_flag, repo_root, venv_exists, venv_python
 
-ENV_NAME = os.environ.get("VENV_PATH", DEFAULT_VENV_DIR)
+ENV_NAME = os.environ.get("VENV_PATH")
 API_HOST = os.environ.get("API_HOST", "0.0.0.0")
 API_PORT = os.environ.get("API_PORT", "18080")
-RELOAD = os.environ.get("UVICORN_RELOAD", "").lower() in {"1", "true", "yes", "on"}
+RELOAD = env_flag("UVICORN_RELOAD")
+
+# Fixed uvicorn arguments that follow the venv interpreter in the launch command
+_UVICORN_BASE = ("-m", "uvicorn", "app.main:app", "--host", API_HOST, "--port", API_PORT)
 
 
 def main() -> None:
-    venv_dir = Path(ENV_NAME)
+    venv_dir = Path(ENV_NAME) if ENV_NAME else default_venv_dir()
+    root = repo_root()
     if not venv_exists(venv_dir):
         sys.exit(f"Venv not found at {venv_dir}. Run service_scripts/create_venv.py first.")
 
-    env_path = REPO_ROOT / ".env"
+    env_path = root / ".env"
     if not env_path.exists():
-        example_env = REPO_ROOT / ".env.local.example"
+        example_env = root / ".env.local.example"
         if example_env.exists():
+            import shutil
+
             shutil.copyfile(example_env, env_path)
             print(f"Created {env_path} from {example_env} for local startup.")
         else:
             sys.exit(f"{env_path} not found and no .env.local.example present.")
 
     venv_py = venv_python(venv_dir)
-    cmd = [
-        str(venv_py),
-        "-m",
-        "uvicorn",
-        "app.main:app",
-        "--host",
-        API_HOST,
-        "--port",
-        API_PORT,
-    ]
-    if RELOAD:
-        cmd.append("--reload")
+    cmd = [str(venv_py), *_UVICORN_BASE, *(("--reload",) if RELOAD else ())]
 
     print("Starting service with:\n ", " ".join(cmd))
+    if os.name != "nt":
+        # Replace this launcher with uvicorn so no idle parent interpreter stays resident.
+        # The service keeps this PID, and signals reach uvicorn directly.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.chdir(root)
+        os.execv(cmd[0], cmd)
+
+    # Windows has no real exec; run uvicorn as a child and wait for it
+    import signal
+    import subprocess
+
     try:
-        subprocess.check_call(cmd, cwd=REPO_ROOT)
+        subprocess.check_call(cmd, cwd=root)
     except subprocess.CalledProcessError as exc:
         if exc.returncode in (-signal.SIGTERM, -signal.SIGINT, signal.SIGTERM, signal.SIGINT):
             print("Service stopped.")
@@ -4,19 +4,52 @@ Helpers for managing a local venv (cross-platform).
 """
 from __future__ import annotations
 
+import functools
 import os
-import shutil
 import sys
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parent.parent
-DEFAULT_VENV_DIR = REPO_ROOT / os.environ.get("VENV_PATH", ".venv")
 PYTHON_BIN = os.environ.get("PYTHON_BIN", "python3.11")
+MIN_PYTHON = (3, 11)
+# Exclusive upper bound, matching requires-python in pyproject.toml
+MAX_PYTHON = (3, 14)
 
+# Location of the interpreter inside a venv, fixed per platform
+_VENV_PY_PARTS: tuple[str, ...] = ("Scripts", "python.exe") if os.name == "nt" else ("bin", "python")
+_VENV_PY_SUBPATH = os.path.join(*_VENV_PY_PARTS)
 
-def _is_windowsapps_stub(path: str) -> bool:
-    if os.name != "nt":
-        return False
+# PATH split once per process; launchers never change it while running
+_PATH_DIRS: tuple[str, ...] = tuple(d for d in os.environ.get("PATH", os.defpath).split(os.pathsep) if d)
+
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def env_flag(name: str) -> bool:
+    """
+    Read a boolean environment toggle ('1', 'true', 'yes' or 'on', case-insensitive).
+    """
+    return os.environ.get(name, "").lower() in _TRUTHY
+
+
+@functools.cache
+def repo_root() -> Path:
+    """
+    Return the repository root, resolving symlinks on first use rather than at import.
+    """
+    return Path(__file__).resolve().parent.parent
+
+
+@functools.cache
+def default_venv_dir() -> Path:
+    """
+    Return the default venv directory (VENV_PATH relative to the repo root, else .venv).
+    """
+    return repo_root() / os.environ.get("VENV_PATH", ".venv")
+
+
+@functools.cache
+def _is_windowsapps_stub_impl(path: str) -> bool:
     try:
         parts = [part.lower() for part in Path(path).resolve().parts]
     except OSError:
@@ -24,11 +57,173 @@ def _is_windowsapps_stub(path: str) -> bool:
     return "windowsapps" in parts
 
 
-def find_python() -> str:
+# WindowsApps launcher stubs only exist on Windows; elsewhere skip the realpath entirely
+_is_windowsapps_stub = _is_windowsapps_stub_impl if os.name == "nt" else (lambda _path: False)
+
+
+@functools.cache
+def _path_index() -> dict[str, list[str]]:
     """
-    Resolve the Python executable to use for creating the venv.
-    Falls back to python3/python if python3.11 is not found.
+    Map each file name found on PATH to its full paths, in PATH order.
+    Each directory is listed once with os.scandir instead of stat-ing every candidate in it.
+    Names are lowercased on Windows, whose filesystems are case-insensitive.
+    """
+    index: dict[str, list[str]] = {}
+    for directory in _PATH_DIRS:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name.lower() if os.name == "nt" else entry.name
+                    index.setdefault(name, []).append(entry.path)
+        except OSError:
+            continue
+    return index
+
+
+def _is_executable_file(path: str) -> bool:
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _which_fast(name: str) -> str | None:
+    """
+    Locate an executable on PATH.
+    Unlike shutil.which this probes only `name` (plus `name.exe` on Windows)
+    rather than every PATHEXT extension in every directory.
+    """
+    names = [name]
+    if os.name == "nt" and not name.lower().endswith(".exe"):
+        names.append(name + ".exe")
+    if os.path.dirname(name):
+        # Already a path; check it directly
+        for candidate in names:
+            if _is_executable_file(candidate):
+                return candidate
+        return None
+
+    index = _path_index()
+    for candidate in names:
+        key = candidate.lower() if os.name == "nt" else candidate
+        for path in index.get(key, ()):
+            if _is_executable_file(path):
+                return path
+    return None
+
+
+@functools.cache
+def _which(cmd: str) -> str | None:
+    return _which_fast(cmd)
+
+
+def _python_cache_file() -> Path:
+    """
+    Location of the on-disk cache of the resolved interpreter path.
+    """
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "doc-processing-service" / "python.path"
+
+
+def _python_cache_key() -> str:
+    """
+    Hash of the inputs that decide which interpreter find_python picks.
+    """
+    import hashlib
+
+    raw = "\0".join(
+        (os.environ.get("PATH", ""), PYTHON_BIN, sys.executable or "", repr(MIN_PYTHON), repr(MAX_PYTHON))
+    )
+    return hashlib.sha256(raw.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def _interpreter_stamp(path: str) -> str:
     """
+    Identify an interpreter binary by mtime and size, so a replaced or upgraded
+    binary no longer matches its cache entry; empty if it cannot be stat'ed.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ""
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_cached_python(key: str) -> str | None:
+    """
+    Return the cached interpreter when the key, the binary's stamp and the
+    stored version all still hold; checked without running the interpreter.
+    """
+    try:
+        lines = _python_cache_file().read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    if len(lines) != 4 or lines[0] != key:
+        return None
+    _, path, stamp, version = lines
+    if not path or not stamp or _interpreter_stamp(path) != stamp:
+        return None
+    try:
+        major, minor = version.split(".")
+        if not _supported_version((int(major), int(minor))):
+            return None
+    except ValueError:
+        return None
+    return path
+
+
+def _write_cached_python(key: str, path: str, version: tuple[int, int]) -> None:
+    """
+    Store the resolved interpreter atomically; failures only cost a PATH search next time.
+    """
+    import tempfile
+
+    stamp = _interpreter_stamp(path)
+    if not stamp:
+        return
+    cache_file = _python_cache_file()
+    tmp_path = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=".python.path.")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(f"{key}\n{path}\n{stamp}\n{version[0]}.{version[1]}\n")
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _supported_version(version: tuple[int, int] | None) -> bool:
+    return version is not None and MIN_PYTHON <= version < MAX_PYTHON
+
+
+@functools.cache
+def _python_version(path: str) -> tuple[int, int] | None:
+    """
+    Return an interpreter's (major, minor) version, probing each path at most once.
+    """
+    if path == sys.executable:
+        return sys.version_info[:2]
+    import subprocess
+
+    try:
+        output = subprocess.check_output(
+            [path, "-c", "import sys; print('%d.%d' % sys.version_info[:2])"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5,
+        )
+        major, minor = output.strip().split(".")
+        return int(major), int(minor)
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def _search_python() -> str | None:
     candidates = [
         PYTHON_BIN,
         sys.executable,
@@ -39,23 +234,79 @@ def find_python() -> str:
     for candidate in candidates:
         if not candidate:
             continue
-        resolved = shutil.which(str(candidate))
-        if resolved and not _is_windowsapps_stub(resolved):
+        resolved = _which(str(candidate))
+        if not resolved or _is_windowsapps_stub(resolved):
+            continue
+        version = _python_version(resolved)
+        if _supported_version(version):
             return resolved
-    sys.exit("No suitable Python executable found. Set PYTHON_BIN to a Python 3.11 path.")
+    return None
+
+
+# Cached for the life of the process; a host that changes PATH afterwards must restart to see it.
+# Across processes the answer is kept on disk, keyed by PATH, PYTHON_BIN, sys.executable and the version range.
+@functools.cache
+def find_python() -> str:
+    """
+    Resolve the Python executable to use for creating the venv.
+    Falls back to python3/python if python3.11 is not found.
+    """
+    # The running interpreter is already a supported version; skip the PATH search unless PYTHON_BIN asks otherwise.
+    # A WindowsApps launcher stub is never used, even when it is the running interpreter.
+    if (
+        "PYTHON_BIN" not in os.environ
+        and _supported_version(sys.version_info[:2])
+        and sys.executable
+        and not _is_windowsapps_stub(sys.executable)
+    ):
+        return sys.executable
+
+    key = _python_cache_key()
+    resolved = _read_cached_python(key)
+    if resolved:
+        return resolved
 
+    resolved = _search_python()
+    if resolved:
+        # Already probed by _search_python; the cached result costs no new subprocess
+        _write_cached_python(key, resolved, _python_version(resolved))
+        return resolved
+    sys.exit(
+        "No suitable Python %d.%d-%d.%d executable found. Set PYTHON_BIN to a Python 3.11 path."
+        % (*MIN_PYTHON, MAX_PYTHON[0], MAX_PYTHON[1] - 1)
+    )
 
-def venv_python(venv_dir: Path = DEFAULT_VENV_DIR) -> Path:
+
+@functools.lru_cache(maxsize=32)
+def venv_python(venv_dir: Path | None = None) -> Path:
     """
     Return the python executable inside the venv.
+    The default venv's path is built once and then served from the cache.
     """
-    if os.name == "nt":
-        return venv_dir / "Scripts" / "python.exe"
-    return venv_dir / "bin" / "python"
+    if venv_dir is None:
+        venv_dir = default_venv_dir()
+    return venv_dir.joinpath(*_VENV_PY_PARTS)
+
 
+# venv_exists results keyed by str(venv_dir); cleared by clear_venv_cache()
+_VENV_EXISTS_CACHE: dict[str, bool] = {}
 
-def venv_exists(venv_dir: Path = DEFAULT_VENV_DIR) -> bool:
+
+def venv_exists(venv_dir: Path | None = None) -> bool:
     """
     Check whether the venv python exists.
+    The result is cached per directory; call clear_venv_cache() after creating or removing a venv.
+    """
+    key = str(venv_dir if venv_dir is not None else default_venv_dir())
+    exists = _VENV_EXISTS_CACHE.get(key)
+    if exists is None:
+        exists = _VENV_EXISTS_CACHE[key] = os.path.exists(os.path.join(key, _VENV_PY_SUBPATH))
+    return exists
+
+
+def clear_venv_cache() -> None:
+    """
+    Forget cached venv paths and existence checks.
     """
-    return venv_python(venv_dir).exists()
+    _VENV_EXISTS_CACHE.clear()
+    venv_python.cache_clear()
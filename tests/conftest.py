@@ -0,0 +1,76 @@
+import re
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from app.adapters.document_processor import docling_document_processor
+from app.adapters.document_processor.docling_document_processor import DoclingDocumentProcessor
+from app.core.ports.token_service import TokenInfo, TokenService
+
+
+class WordTokenService(TokenService):
+    """
+    Deterministic tokenizer for chunking tests: one token per whitespace-separated word.
+    Every text passed to count_tokens is recorded so tests can assert on tokenizer traffic.
+    """
+
+    def __init__(self):
+        self.counted: List[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        self.counted.append(text)
+        return len(text.split())
+
+    def tokenize(self, text: str) -> TokenInfo:
+        words = text.split()
+        return TokenInfo(token_count=len(words), tokens=words)
+
+    def encode_text(self, text: str) -> List[int]:
+        return list(range(len(text.split())))
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[Tuple[int, int]]]:
+        offsets = [match.span() for match in re.finditer(r"\S+", text)]
+        return list(range(len(offsets))), offsets
+
+    def decode_tokens(self, token_ids: List[int]) -> str:
+        raise NotImplementedError
+
+    def split_text_by_tokens(self, text: str, max_tokens: int, overlap_tokens: int = 0) -> List[str]:
+        raise NotImplementedError
+
+    def get_model_info(self) -> Dict[str, Any]:
+        return {"model_name": "words"}
+
+    def estimate_tokens_from_chars(self, char_count: int) -> int:
+        return char_count // 5
+
+
+class JoinChargingTokenService(WordTokenService):
+    """
+    Word tokenizer that also charges a token for every paragraph break, like BPE
+    encoders that give "\\n\\n" its own token; summed per-piece counts undercount joins.
+    """
+
+    def count_tokens(self, text: str) -> int:
+        return super().count_tokens(text) + text.strip().count("\n\n")
+
+
+@pytest.fixture
+def make_processor(monkeypatch):
+    """
+    Build a DoclingDocumentProcessor without loading Docling; only the converter
+    is replaced, so chunking runs exactly as in production.
+    """
+    monkeypatch.setattr(docling_document_processor, "_build_converter", lambda *args: object())
+
+    def factory(token_service: TokenService = None, **kwargs) -> DoclingDocumentProcessor:
+        kwargs.setdefault("chunk_size", 50)
+        kwargs.setdefault("chunk_overlap", 0)
+        kwargs.setdefault("min_chunk_size", 1)
+        return DoclingDocumentProcessor(
+            token_service=token_service or WordTokenService(),
+            preload_models=False,
+            **kwargs
+        )
+
+    return factory
@@ -0,0 +1,75 @@
+import asyncio
+
+from .conftest import JoinChargingTokenService, WordTokenService
+
+
+class SpaceChargingTokenService(WordTokenService):
+    """Word tokenizer that also charges for every space between words"""
+
+    def count_tokens(self, text: str) -> int:
+        return super().count_tokens(text) + max(len(text.split()) - 1, 0)
+
+
+def test_estimate_below_threshold_joins_without_counting(make_processor):
+    tokens = WordTokenService()
+    processor = make_processor(tokens, chunk_size=50)
+
+    chunks = processor._join_within_limit(["a b", "c d"], "\n\n", 4, {})
+
+    assert chunks == ["a b\n\nc d"]
+    assert tokens.counted == []
+
+
+def test_near_limit_chunk_is_recounted_once_and_kept_when_it_fits(make_processor):
+    tokens = WordTokenService()
+    processor = make_processor(tokens, chunk_size=50)
+    pieces = [" ".join(["w"] * 24), " ".join(["w"] * 24)]
+
+    chunks = processor._join_within_limit(pieces, "\n\n", 48, {})
+
+    assert chunks == ["\n\n".join(pieces)]
+    assert tokens.counted == ["\n\n".join(pieces)]
+
+
+def test_chunk_over_limit_is_halved_until_each_part_fits(make_processor):
+    tokens = JoinChargingTokenService()
+    processor = make_processor(tokens, chunk_size=50)
+    pieces = [" ".join([f"p{i}"] * 4) for i in range(12)]
+
+    # 48 summed tokens plus 11 paragraph breaks is over the limit once joined
+    chunks = processor._join_within_limit(pieces, "\n\n", 48, {})
+
+    assert len(chunks) > 1
+    assert all(tokens.count_tokens(chunk) <= 50 for chunk in chunks)
+    assert "\n\n".join(chunks) == "\n\n".join(pieces)
+
+
+def test_single_piece_is_returned_without_counting(make_processor):
+    tokens = WordTokenService()
+    processor = make_processor(tokens, chunk_size=5)
+
+    assert processor._join_within_limit(["a b c d e f"], " ", 6, {}) == ["a b c d e f"]
+    assert tokens.counted == []
+
+
+def test_recursive_split_never_emits_chunks_over_chunk_size(make_processor):
+    tokens = JoinChargingTokenService()
+    processor = make_processor(tokens, chunk_size=50)
+    # Many short paragraphs: the separators the per-paragraph counts miss add up
+    text = "\n\n".join(" ".join(f"p{p}w{i}" for i in range(2 + p % 5)) for p in range(60))
+
+    chunks = asyncio.run(processor._recursive_token_split(text, {}))
+
+    assert all(tokens.count_tokens(chunk) <= 50 for chunk in chunks)
+    assert "\n\n".join(chunks).split() == text.split()
+
+
+def test_word_split_never_emits_chunks_over_chunk_size(make_processor):
+    tokens = SpaceChargingTokenService()
+    processor = make_processor(tokens, chunk_size=50)
+    sentence = " ".join(f"w{i}" for i in range(300))
+
+    chunks = asyncio.run(processor._split_by_words(sentence, {}))
+
+    assert all(tokens.count_tokens(chunk) <= 50 for chunk in chunks)
+    assert " ".join(chunks) == sentence
@@ -0,0 +1,80 @@
+import asyncio
+
+from app.core.domain.entities.document import Document
+from app.core.domain.value_objects.document_type import DocumentType
+
+from .conftest import WordTokenService
+
+
+def _document() -> Document:
+    return Document.create(
+        filename="doc.pdf",
+        original_filename="doc.pdf",
+        file_path="",
+        file_size=0,
+        document_type=DocumentType.PDF,
+    )
+
+
+def _paragraph_text(paragraphs: int = 12, words: int = 20) -> str:
+    return "\n\n".join(
+        " ".join(f"w{p}_{i}" for i in range(words)) for p in range(paragraphs)
+    )
+
+
+def test_count_tokenizes_each_text_once_per_cache(make_processor):
+    tokens = WordTokenService()
+    processor = make_processor(tokens)
+    cache = {}
+
+    assert processor._count("one two three", cache) == 3
+    assert processor._count("one two three", cache) == 3
+
+    assert tokens.counted == ["one two three"]
+    assert cache == {"one two three": 3}
+
+
+def test_count_batch_counts_only_uncached_distinct_texts(make_processor):
+    tokens = WordTokenService()
+    processor = make_processor(tokens)
+    cache = {"a": 1}
+
+    counts = processor._count_batch(["a", "b c", "b c", "d e f"], cache)
+
+    assert counts == [1, 2, 2, 3]
+    assert tokens.counted == ["b c", "d e f"]
+
+
+def test_memo_does_not_outlive_a_chunking_call(make_processor):
+    tokens = WordTokenService()
+    processor = make_processor(tokens, chunk_size=50)
+    text = _paragraph_text()
+
+    asyncio.run(processor._create_token_chunks(_document(), text, {}))
+    first_run = list(tokens.counted)
+    tokens.counted.clear()
+    asyncio.run(processor._create_token_chunks(_document(), text, {}))
+
+    # A memo kept on the shared processor would make the second run count nothing
+    assert tokens.counted == first_run
+
+
+def test_concurrent_chunking_calls_match_sequential_results(make_processor):
+    processor = make_processor(chunk_size=50)
+    texts = [_paragraph_text(paragraphs=8), _paragraph_text(paragraphs=15, words=7)]
+
+    async def chunk_all():
+        return await asyncio.gather(
+            *(processor._create_token_chunks(_document(), text, {}) for text in texts)
+        )
+
+    concurrent = asyncio.run(chunk_all())
+    sequential = [
+        asyncio.run(processor._create_token_chunks(_document(), text, {})) for text in texts
+    ]
+
+    for together, alone in zip(concurrent, sequential):
+        assert [chunk.content for chunk in together] == [chunk.content for chunk in alone]
+        assert [chunk.metadata["chunk_token_count"] for chunk in together] == [
+            len(chunk.content.split()) for chunk in alone
+        ]
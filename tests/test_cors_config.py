@@ -0,0 +1,103 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from app.main import build_cors_config
+
+
+@pytest.fixture
+def cors_env(monkeypatch):
+    """Clear CORS env overrides and the cached config around each test"""
+    for name in ("CORS_ALLOW_ANY", "CORS_ORIGINS", "CORS_ORIGIN_REGEX", "CORS_ALLOW_CREDENTIALS"):
+        monkeypatch.delenv(name, raising=False)
+    build_cors_config.cache_clear()
+    yield monkeypatch
+    build_cors_config.cache_clear()
+
+
+def test_allow_any_reflects_every_origin(cors_env):
+    origins, regex, allow_credentials = build_cors_config()
+
+    assert origins == ()
+    assert regex.fullmatch("https://anything.example:8443")
+    assert allow_credentials is True
+
+
+@pytest.mark.parametrize("origin", [
+    "http://localhost:5173",
+    "http://127.0.0.1",
+    "http://10.1.2.149:5273",
+    "https://192.168.0.12:8080",
+    "http://172.16.0.1",
+    "http://172.31.255.255:3000",
+])
+def test_default_regex_accepts_local_and_lan_origins(cors_env, origin):
+    cors_env.setenv("CORS_ALLOW_ANY", "0")
+
+    _, regex, _ = build_cors_config()
+
+    assert regex.fullmatch(origin)
+
+
+@pytest.mark.parametrize("origin", [
+    "http://172.32.0.1",
+    "http://172.15.0.1",
+    "http://10.1.2.3.evil.example",
+    "https://evil.example",
+    "http://localhost.evil.example",
+    "ftp://localhost",
+    # re.ASCII keeps \d from matching non-ASCII digits
+    "http://10.١.2.3",
+])
+def test_default_regex_rejects_other_origins(cors_env, origin):
+    cors_env.setenv("CORS_ALLOW_ANY", "0")
+
+    _, regex, _ = build_cors_config()
+
+    assert regex.fullmatch(origin) is None
+
+
+def test_invalid_regex_is_disabled_instead_of_raising(cors_env):
+    cors_env.setenv("CORS_ALLOW_ANY", "0")
+    cors_env.setenv("CORS_ORIGIN_REGEX", "https?://(unclosed")
+
+    _, regex, _ = build_cors_config()
+
+    assert regex is None
+
+
+def test_extra_origins_are_appended_once_and_config_is_cached(cors_env):
+    cors_env.setenv("CORS_ALLOW_ANY", "0")
+    cors_env.setenv("CORS_ORIGINS", "https://app.example, http://localhost:5173,")
+
+    origins, _, _ = build_cors_config()
+
+    assert origins.count("http://localhost:5173") == 1
+    assert origins[-1] == "https://app.example"
+    assert build_cors_config() is build_cors_config()
+
+
+def test_compiled_regex_is_honoured_by_cors_middleware(cors_env):
+    cors_env.setenv("CORS_ALLOW_ANY", "0")
+    origins, regex, allow_credentials = build_cors_config()
+    app = FastAPI()
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_origin_regex=regex,
+        allow_credentials=allow_credentials,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    client = TestClient(app)
+
+    def preflight(origin):
+        return client.options(
+            "/", headers={"Origin": origin, "Access-Control-Request-Method": "POST"}
+        )
+
+    assert preflight("http://192.168.1.20:5273").headers.get("access-control-allow-origin") == (
+        "http://192.168.1.20:5273"
+    )
+    assert "access-control-allow-origin" not in preflight("https://evil.example").headers
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+from app.core.domain.value_objects.document_type import (
+    FILENAME_MAP,
+    MIME_TYPE_MAP,
+    DocumentType,
+    get_mime_type,
+)
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ("report.pdf", DocumentType.PDF),
+    ("REPORT.PDF", DocumentType.PDF),
+    ("letter.docx", DocumentType.DOCX),
+    ("legacy.doc", DocumentType.DOC),
+    ("notes.md", DocumentType.MARKDOWN),
+    ("page.html", DocumentType.HTML),
+    ("page.htm", DocumentType.HTML),
+    ("deck.PpTx", DocumentType.PPTX),
+    ("deck.ppt", DocumentType.PPTX),
+    ("archive.tar.pdf", DocumentType.PDF),
+    ("a..pdf", DocumentType.PDF),
+    ("archive.tar.gz", DocumentType.UNKNOWN),
+    ("README", DocumentType.UNKNOWN),
+    ("name.", DocumentType.UNKNOWN),
+    (".pdf", DocumentType.UNKNOWN),
+    ("dir/.pdf", DocumentType.UNKNOWN),
+    ("dir.v2/file", DocumentType.UNKNOWN),
+    ("dir/report.pdf", DocumentType.PDF),
+])
+def test_from_filename(filename, expected):
+    assert DocumentType.from_filename(filename) == expected
+
+
+@pytest.mark.parametrize("filename", [
+    "a.pdf", "A.DOCX", "x.tar.md", ".pdf", "..pdf", "name.", "...", "dir/.htm", "dir.v2/file", "a.pdf ",
+])
+def test_from_filename_matches_path_suffix(filename):
+    expected = FILENAME_MAP.get(Path(filename).suffix.lower().lstrip("."), DocumentType.UNKNOWN)
+
+    assert DocumentType.from_filename(filename) == expected
+
+
+def test_from_filename_returns_interned_constants():
+    assert DocumentType.from_filename("report.PDF") is DocumentType.PDF
+    assert DocumentType.from_filename("README") is DocumentType.UNKNOWN
+
+
+@pytest.mark.parametrize("mime_type, expected", [
+    ("application/pdf", DocumentType.PDF),
+    ("Application/PDF", DocumentType.PDF),
+    ("application/vnd.ms-powerpoint", DocumentType.PPTX),
+    ("image/png", DocumentType.UNKNOWN),
+])
+def test_from_mime_type(mime_type, expected):
+    assert DocumentType.from_mime_type(mime_type) == expected
+
+
+@pytest.mark.parametrize("document_type, expected", [
+    (DocumentType.PDF, "application/pdf"),
+    (DocumentType.MARKDOWN, "text/markdown"),
+    (DocumentType.PPTX, "application/vnd.openxmlformats-officedocument.presentationml.presentation"),
+    (DocumentType.UNKNOWN, "application/octet-stream"),
+    ("not-a-type", "application/octet-stream"),
+])
+def test_get_mime_type(document_type, expected):
+    assert get_mime_type(document_type) == expected
+
+
+def test_get_mime_type_round_trips_through_from_mime_type():
+    for document_type in set(MIME_TYPE_MAP.values()):
+        assert DocumentType.from_mime_type(get_mime_type(document_type)) == document_type
@@ -0,0 +1,68 @@
+from typing import List, Tuple
+
+import pytest
+
+from app.core.domain.exceptions import TokenizationError
+
+from .conftest import WordTokenService
+
+
+class NoOffsetsTokenService(WordTokenService):
+    """Tokenizer that keeps the port's default encode_with_offsets"""
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[Tuple[int, int]]]:
+        return super(WordTokenService, self).encode_with_offsets(text)
+
+
+def _words(count: int) -> str:
+    return " ".join(f"w{i}" for i in range(count))
+
+
+def test_text_within_one_window_is_returned_whole(make_processor):
+    processor = make_processor(chunk_size=50, split_method="sliding_window")
+
+    assert processor._sliding_window_split(_words(50)) == [_words(50)]
+    assert processor._sliding_window_split("") == []
+
+
+def test_windows_hold_chunk_size_tokens_and_overlap(make_processor):
+    processor = make_processor(chunk_size=50, chunk_overlap=10, split_method="sliding_window")
+    words = _words(200).split()
+
+    chunks = processor._sliding_window_split(" ".join(words))
+
+    assert all(len(chunk.split()) <= 50 for chunk in chunks)
+    # Without sentence or paragraph breaks nothing snaps, so each window starts one stride on
+    assert [chunk.split()[0] for chunk in chunks] == [words[i] for i in range(0, 200 - 10, 40)]
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.split()[-10:] == current.split()[:10]
+    assert chunks[-1].split()[-1] == words[-1]
+
+
+def test_window_ends_snap_to_sentence_breaks(make_processor):
+    # An end may only move back into the overlap, so a 10-token overlap with
+    # 9-word sentences always leaves a break within reach
+    processor = make_processor(chunk_size=20, chunk_overlap=10, split_method="sliding_window")
+    sentences = [" ".join(f"s{s}w{i}" for i in range(9)) + "." for s in range(8)]
+    text = " ".join(sentences)
+
+    chunks = processor._sliding_window_split(text)
+
+    assert all(chunk.endswith(".") for chunk in chunks)
+    assert all(len(chunk.split()) <= 20 for chunk in chunks)
+    # Snapping never opens a gap: every word is still in some chunk
+    assert set(" ".join(chunks).split()) == set(text.split())
+
+
+def test_tokenizer_without_offsets_falls_back_to_character_split(make_processor):
+    tokens = NoOffsetsTokenService()
+    processor = make_processor(tokens, chunk_size=10, split_method="sliding_window")
+    text = _words(100)
+
+    with pytest.raises(TokenizationError):
+        tokens.encode_with_offsets(text)
+
+    chunks = processor._sliding_window_split(text)
+
+    assert chunks == processor._fallback_character_split(text)
+    assert "".join(chunks).replace(" ", "") == text.replace(" ", "")
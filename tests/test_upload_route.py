@@ -0,0 +1,148 @@
+import asyncio
+import io
+import os
+from typing import List, Tuple
+
+import pytest
+from fastapi import FastAPI, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+
+from app.api.deps import authenticate_user, get_document_processor
+from app.api.routes.documents import _save_upload, router
+from app.config import settings
+from app.core.domain.entities.document import Document
+from app.core.domain.entities.document_chunk import DocumentChunk
+from app.core.ports.document_processor import DocumentProcessor
+
+PDF_BYTES = b"%PDF-1.4 test document"
+
+
+class RecordingProcessor(DocumentProcessor):
+    """Processor double that records how each document reached it"""
+
+    def __init__(self, accepts_in_memory_content: bool):
+        self.accepts_in_memory_content = accepts_in_memory_content
+        self.seen: List[dict] = []
+
+    def _record(self, document: Document) -> None:
+        on_disk = None
+        if document.file_path and os.path.exists(document.file_path):
+            with open(document.file_path, "rb") as handle:
+                on_disk = handle.read()
+        self.seen.append({
+            "content": document.content,
+            "file_path": document.file_path,
+            "on_disk": on_disk,
+        })
+
+    async def process_document(self, document: Document) -> Tuple[List[DocumentChunk], str]:
+        self._record(document)
+        return [], "text"
+
+    def get_supported_types(self) -> List[str]:
+        return ["pdf"]
+
+
+@pytest.fixture
+def upload_client(tmp_path, monkeypatch):
+    """Return a factory building a client whose routes use the given processor"""
+    monkeypatch.setattr(settings, "UPLOADS_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "RAMDISK_UPLOADS", False)
+    monkeypatch.setattr(settings, "IN_MEMORY_UPLOAD_MAX_SIZE", 1024)
+
+    def factory(processor: DocumentProcessor) -> TestClient:
+        app = FastAPI()
+        app.include_router(router, prefix="/documents")
+        app.dependency_overrides[get_document_processor] = lambda: processor
+        app.dependency_overrides[authenticate_user] = lambda: None
+        return TestClient(app)
+
+    return factory
+
+
+def _upload(client: TestClient, data: bytes = PDF_BYTES, name: str = "doc.pdf"):
+    return client.post("/documents/upload", files={"file": (name, data, "application/pdf")})
+
+
+def test_small_upload_stays_in_memory_for_content_aware_processor(upload_client, tmp_path):
+    processor = RecordingProcessor(accepts_in_memory_content=True)
+
+    response = _upload(upload_client(processor))
+
+    assert response.status_code == 200
+    assert processor.seen == [{"content": PDF_BYTES, "file_path": "", "on_disk": None}]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_small_upload_goes_to_disk_for_path_only_processor(upload_client, tmp_path):
+    processor = RecordingProcessor(accepts_in_memory_content=False)
+
+    response = _upload(upload_client(processor))
+
+    assert response.status_code == 200
+    [seen] = processor.seen
+    assert seen["content"] is None
+    assert os.path.dirname(seen["file_path"]) == str(tmp_path)
+    assert seen["on_disk"] == PDF_BYTES
+    # The staged file is removed once processing finishes
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upload_over_in_memory_limit_goes_to_disk(upload_client, tmp_path):
+    processor = RecordingProcessor(accepts_in_memory_content=True)
+    large = PDF_BYTES + b"x" * 2048
+
+    response = _upload(upload_client(processor), data=large)
+
+    assert response.status_code == 200
+    [seen] = processor.seen
+    assert seen["content"] is None
+    assert seen["on_disk"] == large
+
+
+def test_batch_upload_respects_the_processor_capability(upload_client):
+    processor = RecordingProcessor(accepts_in_memory_content=False)
+    client = upload_client(processor)
+
+    response = client.post(
+        "/documents/upload/batch",
+        files=[
+            ("files", ("a.pdf", PDF_BYTES, "application/pdf")),
+            ("files", ("b.pdf", PDF_BYTES + b"b", "application/pdf")),
+        ],
+    )
+
+    assert response.status_code == 200
+    assert [seen["content"] for seen in processor.seen] == [None, None]
+    assert [seen["on_disk"] for seen in processor.seen] == [PDF_BYTES, PDF_BYTES + b"b"]
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_upload_over_max_file_size_is_rejected(upload_client, tmp_path, monkeypatch, in_memory):
+    monkeypatch.setattr(settings, "UPLOAD_MAX_FILE_SIZE", len(PDF_BYTES) - 1)
+    processor = RecordingProcessor(accepts_in_memory_content=in_memory)
+
+    response = _upload(upload_client(processor))
+
+    assert response.status_code == 413
+    assert processor.seen == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upload_at_max_file_size_is_accepted(upload_client, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_MAX_FILE_SIZE", len(PDF_BYTES))
+    processor = RecordingProcessor(accepts_in_memory_content=False)
+
+    assert _upload(upload_client(processor)).status_code == 200
+
+
+def test_undeclared_size_is_checked_while_streaming(upload_client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_MAX_FILE_SIZE", 1024)
+    upload = UploadFile(file=io.BytesIO(b"x" * 4096), filename="big.pdf", size=None)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(_save_upload(upload, "pdf", in_memory=True))
+
+    assert excinfo.value.status_code == 413
+    # The partially written file is removed
+    assert list(tmp_path.iterdir()) == []